@@ -2,8 +2,13 @@
 Traffic controller for orchestrating traffic analysis workflow
 """
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
+import bisect
+import dataclasses
+import functools
 import logging
+import re
+import sys
 
 from models.data_models import (
     TrafficConfig, TrafficAnalysis, CongestionResult, AreaInfo, CongestionLevel
@@ -14,14 +19,85 @@ from reasoning.reasoning_engine import ReasoningEngine
 from filtering.content_filter import ContentFilter, FilterPreferences
 
 
-# Set up logging for error tracking
-logging.basicConfig(level=logging.WARNING)
+# Logging is configured by the host application (CLI, Streamlit); importing
+# this module must not install handlers on the root logger
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Shared rule labels for results built outside the scoring engine. Results
+# carry list copies: callers treat triggered_rules as a mutable list.
+_ERROR_RULES = ("Error condition",)
+_FALLBACK_RULES = ("Fallback due to calculation error",)
+
+
+def _compile_alternation(names) -> Optional["re.Pattern[str]"]:
+    """Compile names into one alternation, longest first, for a single-pass scan"""
+    if not names:
+        return None
+    ordered = sorted(names, key=len, reverse=True)
+    return re.compile("|".join(re.escape(name) for name in ordered))
+
+
+class _KnownNames:
+    """Lowercased known names, in config order, with containment checks in both directions"""
+    
+    __slots__ = ('names', '_pattern', '_joined', '_starts')
+    
+    # Joins names for the reverse check; never part of a name or a query
+    _SEPARATOR = '\x00'
+    
+    def __init__(self, names):
+        self.names = list(names)
+        self._pattern = _compile_alternation(self.names)
+        self._joined = self._SEPARATOR.join(self.names)
+        self._starts = []
+        offset = 0
+        for name in self.names:
+            self._starts.append(offset)
+            offset += len(name) + 1
+    
+    def find(self, area_lower: str) -> Optional[str]:
+        """Find the first known name, in config order, contained in or containing area_lower"""
+        # The query may itself be a fragment of a known name; one scan of the
+        # joined names finds the first such name
+        containing_index = len(self.names)
+        if self._SEPARATOR not in area_lower:
+            offset = self._joined.find(area_lower)
+            if offset >= 0:
+                containing_index = bisect.bisect_right(self._starts, offset) - 1
+        
+        # One regex pass rules out queries with no known name inside them; on a
+        # hit, only the names listed earlier than any containing one are checked
+        if self._pattern is not None and self._pattern.search(area_lower):
+            for name in self.names[:containing_index]:
+                if name in area_lower:
+                    return name
+        
+        if containing_index == len(self.names):
+            return None
+        return self.names[containing_index]
+
+
+def _clean(value: Optional[str]) -> str:
+    """Strip surrounding whitespace, treating None as an empty string"""
+    return value.strip() if value else ''
+
+
+def _normalize(name: str) -> str:
+    """Case-fold a name for lookups, interning it so repeated names share one string"""
+    return sys.intern(name.casefold())
 
 
 class TrafficController:
     """Controller class to coordinate analysis workflow"""
     
+    # Fixed attribute layout: no per-instance __dict__ and faster attribute access
+    __slots__ = (
+        'parser', 'config', 'scoring_engine', 'reasoning_engine', 'content_filter',
+        '_initialization_error', '_resolve_area_cached', '_area_to_zone',
+        '_hotspot_names', '_known_areas', '_known_hotspots', '_safe_base_level', '_unknown_area_congestion',
+    )
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize traffic controller with configuration
@@ -36,17 +112,26 @@ class TrafficController:
         self.content_filter = ContentFilter()
         self._initialization_error = None
         
+        # Area lookups repeat heavily within and across requests; cache them per
+        # controller so the cache is discarded together with the loaded config
+        self._resolve_area_cached = functools.lru_cache(maxsize=4096)(self._resolve_area)
+        self._area_to_zone = {}
+        self._hotspot_names = {}
+        self._known_areas = _KnownNames(())
+        self._known_hotspots = _KnownNames(())
+        
         try:
             self.config = self.parser.load_config(config_path)
+            self._build_area_indices()
             
             # Validate configuration
             validation = self.parser.validate_config(self.config)
             if not validation.is_valid:
-                logger.warning(f"Configuration validation issues: {validation.errors}")
+                logger.warning("Configuration validation issues: %s", validation.errors)
                 # Continue with potentially invalid config, but log the issues
             
             if validation.warnings:
-                logger.info(f"Configuration warnings: {validation.warnings}")
+                logger.info("Configuration warnings: %s", validation.warnings)
             
             self.scoring_engine = ScoringEngine(self.config)
             self.reasoning_engine = ReasoningEngine(self.config)
@@ -57,6 +142,22 @@ class TrafficController:
         except Exception as e:
             self._initialization_error = f"Failed to initialize traffic controller due to configuration issues: {e}"
             logger.error(self._initialization_error)
+        
+        # Config-derived values used on every request are resolved once here
+        scoring_rules = self.config.scoring_rules if self.config else None
+        self._safe_base_level = (
+            scoring_rules.base_score_level if scoring_rules else CongestionLevel.LOW
+        )
+        
+        # The unknown-area result only varies in its reasoning text, so build
+        # the invariant part once per loaded config
+        self._unknown_area_congestion = CongestionResult(
+            level=self._safe_base_level,
+            score=0,
+            triggered_rules=[],
+            departure_recommendation="Unable to provide recommendation for unknown area",
+            reasoning=""
+        )
     
     def analyze_route(self, origin: str, destination: str, 
                      departure_time: datetime) -> TrafficAnalysis:
@@ -71,88 +172,90 @@ class TrafficController:
         Returns:
             TrafficAnalysis with congestion, warnings, and recommendations
         """
+        return self._analyze_route(origin, destination, departure_time, {})
+    
+    def analyze_routes(self, routes: Iterable[Tuple[str, str, datetime]]) -> list[TrafficAnalysis]:
+        """
+        Analyze several routes in one call
+        
+        Each distinct area name is resolved once for the whole batch, so
+        callers evaluating many routes should prefer this over calling
+        analyze_route in a loop.
+        
+        Args:
+            routes: (origin, destination, departure_time) tuples
+            
+        Returns:
+            TrafficAnalysis for each route, in input order
+        """
+        area_infos = {}
+        return [
+            self._analyze_route(origin, destination, departure_time, area_infos)
+            for origin, destination, departure_time in routes
+        ]
+    
+    def _analyze_route(self, origin: str, destination: str, departure_time: datetime,
+                       area_infos: Dict[str, AreaInfo]) -> TrafficAnalysis:
+        """Analyze one route, reusing and filling area_infos keyed by cleaned name"""
         # Check if controller was initialized properly
         if self._initialization_error:
             return self._create_error_analysis(self._initialization_error)
         
         try:
-            # Validate inputs
-            if not origin or not origin.strip():
+            # Validate inputs, stripping each name once for lookups and scoring;
+            # messages keep the names as given
+            origin_clean = _clean(origin)
+            destination_clean = _clean(destination)
+            
+            if not origin_clean:
                 return self._create_error_analysis("Origin location cannot be empty. Please provide a valid starting location.")
             
-            if not destination or not destination.strip():
+            if not destination_clean:
                 return self._create_error_analysis("Destination location cannot be empty. Please provide a valid ending location.")
             
             if not departure_time:
                 return self._create_error_analysis("Departure time is required. Please provide a valid departure time.")
             
             # Check if areas are known
-            origin_info = self.get_area_info(origin)
-            destination_info = self.get_area_info(destination)
+            origin_info = area_infos.get(origin_clean)
+            if origin_info is None:
+                origin_info = area_infos[origin_clean] = self._lookup_area(origin_clean)
+            destination_info = area_infos.get(destination_clean)
+            if destination_info is None:
+                destination_info = area_infos[destination_clean] = self._lookup_area(destination_clean)
             
             # Handle unknown areas
             if not origin_info.zone and not origin_info.is_hotspot:
-                unknown_suggestion = self.suggest_area_addition(origin)
-                return TrafficAnalysis(
-                    congestion=CongestionResult(
-                        level=self._get_safe_base_level(),
-                        score=0,
-                        triggered_rules=[],
-                        departure_recommendation="Unable to provide recommendation for unknown area",
-                        reasoning=unknown_suggestion
-                    ),
-                    hotspot_warnings=[],
-                    departure_window="",
-                    detailed_reasoning=unknown_suggestion
-                )
+                return self._create_unknown_area_analysis(origin)
             
             if not destination_info.zone and not destination_info.is_hotspot:
-                unknown_suggestion = self.suggest_area_addition(destination)
-                return TrafficAnalysis(
-                    congestion=CongestionResult(
-                        level=self._get_safe_base_level(),
-                        score=0,
-                        triggered_rules=[],
-                        departure_recommendation="Unable to provide recommendation for unknown area",
-                        reasoning=unknown_suggestion
-                    ),
-                    hotspot_warnings=[],
-                    departure_window="",
-                    detailed_reasoning=unknown_suggestion
-                )
-            
-            # Calculate congestion using scoring engine with error handling
-            try:
-                congestion_result = self.scoring_engine.calculate_congestion(
-                    origin, destination, departure_time
-                )
-            except Exception as e:
-                logger.error(f"Error in congestion calculation: {e}")
-                # Fall back to conservative estimate
-                congestion_result = self._create_fallback_congestion_result(
-                    f"Unable to calculate precise congestion due to system error. Using conservative estimate. Error: {e}"
-                )
-            
-            # Generate hotspot warnings with error handling
-            try:
-                hotspot_warnings = self._generate_hotspot_warnings(origin, destination)
-            except Exception as e:
-                logger.error(f"Error generating hotspot warnings: {e}")
-                hotspot_warnings = ["Unable to generate hotspot warnings due to system error"]
-            
-            # Generate departure window recommendation with error handling
-            try:
-                departure_window = self._generate_departure_window(congestion_result, departure_time)
-            except Exception as e:
-                logger.error(f"Error generating departure window: {e}")
-                departure_window = "Unable to generate departure window recommendation"
-            
-            # Generate detailed reasoning with error handling
-            try:
-                detailed_reasoning = self.reasoning_engine.format_detailed_reasoning(congestion_result)
-            except Exception as e:
-                logger.error(f"Error generating detailed reasoning: {e}")
-                detailed_reasoning = "Unable to generate detailed reasoning due to system error"
+                return self._create_unknown_area_analysis(destination)
+            
+            # Each step degrades to a safe fallback on its own so one failure
+            # does not lose the rest of the analysis; _safe logs the exception
+            # with its traceback, so user-facing fallbacks carry no error text
+            congestion_result = self._safe(
+                self.scoring_engine.calculate_congestion,
+                lambda: self._create_fallback_congestion_result(
+                    "Unable to calculate precise congestion due to system error. Using conservative estimate."
+                ),
+                origin_clean, destination_clean, departure_time
+            )
+            hotspot_warnings = self._safe(
+                self._generate_hotspot_warnings,
+                lambda: ["Unable to generate hotspot warnings due to system error"],
+                origin, destination, origin_info, destination_info
+            )
+            departure_window = self._safe(
+                self._generate_departure_window,
+                "Unable to generate departure window recommendation",
+                congestion_result, departure_time
+            )
+            detailed_reasoning = self._safe(
+                self.reasoning_engine.format_detailed_reasoning,
+                "Unable to generate detailed reasoning due to system error",
+                congestion_result
+            )
             
             return TrafficAnalysis(
                 congestion=congestion_result,
@@ -162,11 +265,31 @@ class TrafficController:
             )
             
         except Exception as e:
-            logger.error(f"Unexpected error in route analysis: {e}")
+            logger.error("Unexpected error in route analysis: %s", e, exc_info=True)
             return self._create_error_analysis(
                 f"An unexpected error occurred during route analysis. Please try again or contact support if the problem persists. Error: {e}"
             )
     
+    @staticmethod
+    def _safe(fn, fallback, *args):
+        """
+        Call fn(*args), logging any error and returning a fallback instead
+        
+        Args:
+            fn: Callable to run
+            fallback: Value to return on error, or a zero-argument callable
+                that builds it so the happy path allocates nothing
+            *args: Positional arguments for fn
+            
+        Returns:
+            Result of fn, or the fallback if fn raised
+        """
+        try:
+            return fn(*args)
+        except Exception:
+            logger.error("Error in %s", getattr(fn, '__name__', fn), exc_info=True)
+            return fallback() if callable(fallback) else fallback
+    
     def analyze_route_with_preferences(self, origin: str, destination: str, 
                                      departure_time: datetime,
                                      avoid_nightlife: bool = False,
@@ -185,6 +308,10 @@ class TrafficController:
             TrafficAnalysis with filtered content based on preferences
         """
         try:
+            # Without preferences there is nothing to filter
+            if not (avoid_nightlife or prefer_family_friendly):
+                return self.analyze_route(origin, destination, departure_time)
+            
             # Create filter preferences
             preferences = FilterPreferences(
                 avoid_nightlife=avoid_nightlife,
@@ -200,7 +327,7 @@ class TrafficController:
             return filtered_analysis
             
         except Exception as e:
-            logger.error(f"Error in route analysis with preferences: {e}")
+            logger.error("Error in route analysis with preferences: %s", e)
             return self._create_error_analysis(
                 f"Unable to analyze route with preferences due to system error: {e}"
             )
@@ -215,60 +342,65 @@ class TrafficController:
         Returns:
             AreaInfo with zone classification and hotspot status
         """
+        area_clean = _clean(area_name)
+        if not area_clean:
+            return AreaInfo(name="", zone=None, is_hotspot=False, nearby_landmark=None)
+        
+        return self._lookup_area(area_clean, display_name=area_name)
+    
+    def _lookup_area(self, area_clean: str, display_name: Optional[str] = None) -> AreaInfo:
+        """Look up an area name that has already been stripped and checked non-empty"""
+        name = area_clean if display_name is None else display_name
         try:
-            if not area_name or not area_name.strip():
-                return AreaInfo(name="", zone=None, is_hotspot=False, nearby_landmark=None)
-            
             # Handle case where config is not available
             if not self.config:
-                return AreaInfo(name=area_name, zone=None, is_hotspot=False, nearby_landmark=None)
-            
-            area_lower = area_name.lower()
-            
-            # Check which zone the area belongs to
-            zone = None
-            if self.config.zones:
-                for zone_name, areas in self.config.zones.items():
-                    if areas:  # Check if areas list is not None
-                        for area in areas:
-                            if (area.lower() in area_lower or 
-                                area_lower in area.lower() or
-                                area.lower() == area_lower):
-                                zone = zone_name
-                                break
-                    if zone:
-                        break
-            
-            # Check if area is a hotspot
-            is_hotspot = False
-            if self.config.hotspots:
-                is_hotspot = any(
-                    hotspot.lower() in area_lower or 
-                    area_lower in hotspot.lower() or
-                    hotspot.lower() == area_lower
-                    for hotspot in self.config.hotspots
-                )
-            
-            # Find nearby landmark (use first matching hotspot as landmark)
-            nearby_landmark = None
-            if is_hotspot and self.config.hotspots:
-                for hotspot in self.config.hotspots:
-                    if (hotspot.lower() in area_lower or 
-                        area_lower in hotspot.lower()):
-                        nearby_landmark = hotspot
-                        break
+                return AreaInfo(name=name, zone=None, is_hotspot=False, nearby_landmark=None)
+            
+            zone, is_hotspot, nearby_landmark = self._resolve_area_cached(_normalize(area_clean))
             
             return AreaInfo(
-                name=area_name,
+                name=name,
                 zone=zone,
                 is_hotspot=is_hotspot,
                 nearby_landmark=nearby_landmark
             )
             
         except Exception as e:
-            logger.error(f"Error getting area info for {area_name}: {e}")
+            logger.error("Error getting area info for %s: %s", name, e)
             # Return safe default
-            return AreaInfo(name=area_name, zone=None, is_hotspot=False, nearby_landmark=None)
+            return AreaInfo(name=name, zone=None, is_hotspot=False, nearby_landmark=None)
+    
+    def _resolve_area(self, area_lower: str) -> Tuple[Optional[str], bool, Optional[str]]:
+        """Resolve a lowercased area name to (zone, is_hotspot, nearby_landmark)"""
+        # The first area in config order that matches decides the zone, even when
+        # the query names several areas; results are cached per query
+        zone = None
+        known_area = self._known_areas.find(area_lower)
+        if known_area is not None:
+            zone = self._area_to_zone[known_area]
+        
+        # Use the first matching hotspot as the nearby landmark
+        nearby_landmark = None
+        hotspot_lower = self._known_hotspots.find(area_lower)
+        if hotspot_lower is not None:
+            nearby_landmark = self._hotspot_names[hotspot_lower]
+        is_hotspot = nearby_landmark is not None
+        
+        return zone, is_hotspot, nearby_landmark
+    
+    def _build_area_indices(self):
+        """Precompute lowercased zone and hotspot lookups from the loaded config"""
+        # The parser already indexes areas by casefolded name
+        self._area_to_zone = {
+            sys.intern(area): zone_name for area, zone_name in self.config.area_to_zone.items()
+        }
+        
+        self._hotspot_names = {}
+        for hotspot in self.config.hotspots or []:
+            self._hotspot_names.setdefault(_normalize(hotspot), hotspot)
+        
+        self._known_areas = _KnownNames(self._area_to_zone)
+        self._known_hotspots = _KnownNames(self._hotspot_names)
     
     def suggest_area_addition(self, area_name: str) -> str:
         """
@@ -287,7 +419,7 @@ class TrafficController:
             return f"That area isn't in my local dataset yet—add it to product.md. " \
                    f"To add '{area_name}', please provide: area name, zone tag, nearby landmark, and hotspot status."
         except Exception as e:
-            logger.error(f"Error generating area addition suggestion: {e}")
+            logger.error("Error generating area addition suggestion: %s", e)
             return "Unable to generate area addition suggestion due to system error."
     
     def _create_error_analysis(self, error_message: str) -> TrafficAnalysis:
@@ -296,7 +428,7 @@ class TrafficController:
             congestion=CongestionResult(
                 level=CongestionLevel.HIGH,  # Conservative estimate for errors
                 score=2,
-                triggered_rules=["Error condition"],
+                triggered_rules=list(_ERROR_RULES),
                 departure_recommendation="Please try again later",
                 reasoning=error_message
             ),
@@ -305,45 +437,49 @@ class TrafficController:
             detailed_reasoning=error_message
         )
     
+    def _create_unknown_area_analysis(self, area_name: str) -> TrafficAnalysis:
+        """Create a TrafficAnalysis prompting the user to add an unknown area"""
+        unknown_suggestion = self.suggest_area_addition(area_name)
+        return TrafficAnalysis(
+            # Fresh lists keep results independent when callers mutate them
+            congestion=dataclasses.replace(
+                self._unknown_area_congestion,
+                triggered_rules=[],
+                reasoning=unknown_suggestion
+            ),
+            hotspot_warnings=[],
+            departure_window="",
+            detailed_reasoning=unknown_suggestion
+        )
+    
     def _create_fallback_congestion_result(self, error_message: str) -> CongestionResult:
         """Create a fallback congestion result for calculation errors"""
         return CongestionResult(
             level=CongestionLevel.HIGH,  # Conservative estimate
             score=2,
-            triggered_rules=["Fallback due to calculation error"],
+            triggered_rules=list(_FALLBACK_RULES),
             departure_recommendation="Consider avoiding peak hours as a precaution",
             reasoning=f"Using conservative traffic estimate. {error_message}"
         )
     
-    def _get_safe_base_level(self) -> CongestionLevel:
-        """Get a safe base congestion level, handling config errors"""
-        try:
-            if self.config and self.config.scoring_rules:
-                return self.config.scoring_rules.base_score_level
-            else:
-                return CongestionLevel.LOW  # Safe default
-        except Exception:
-            return CongestionLevel.LOW  # Safe default
-    
-    def _generate_hotspot_warnings(self, origin: str, destination: str) -> list[str]:
-        """Generate warnings for hotspot locations"""
+    def _generate_hotspot_warnings(self, origin: str, destination: str,
+                                   origin_info: AreaInfo, destination_info: AreaInfo) -> list[str]:
+        """Generate warnings for hotspot locations from already resolved area info"""
         try:
             warnings = []
             
             # Check origin
-            origin_info = self.get_area_info(origin)
             if origin_info.is_hotspot:
                 warnings.append(f"Origin {origin} is a known traffic hotspot")
             
             # Check destination
-            destination_info = self.get_area_info(destination)
             if destination_info.is_hotspot:
                 warnings.append(f"Destination {destination} is a known traffic hotspot")
             
             return warnings
             
         except Exception as e:
-            logger.error(f"Error generating hotspot warnings: {e}")
+            logger.error("Error generating hotspot warnings: %s", e)
             return ["Unable to check for traffic hotspots due to system error"]
     
     def _generate_departure_window(self, congestion_result: CongestionResult, 
@@ -354,12 +490,12 @@ class TrafficController:
                 return "Unable to generate departure window recommendation"
             
             if congestion_result.departure_recommendation == "leave now":
-                return f"Optimal departure: now (around {departure_time.strftime('%H:%M')})"
+                return f"Optimal departure: now (around {departure_time.hour:02d}:{departure_time.minute:02d})"
             else:
                 return f"Consider: {congestion_result.departure_recommendation}"
                 
         except Exception as e:
-            logger.error(f"Error generating departure window: {e}")
+            logger.error("Error generating departure window: %s", e)
             return "Unable to generate departure window due to system error"
     
     def _apply_content_filtering(self, analysis: TrafficAnalysis, 
@@ -369,12 +505,19 @@ class TrafficController:
             if not analysis or not preferences:
                 return analysis
             
-            # Filter congestion result text
-            filtered_reasoning = self.content_filter.filter_text(
-                analysis.congestion.reasoning, preferences
-            )
-            filtered_departure_rec = self.content_filter.filter_text(
-                analysis.congestion.departure_recommendation, preferences
+            if not (preferences.avoid_nightlife or preferences.prefer_family_friendly):
+                return analysis
+            
+            # Filter all free-text fields in one batch
+            (filtered_reasoning, filtered_departure_rec,
+             filtered_departure_window, filtered_detailed_reasoning) = self.content_filter.filter_texts(
+                [
+                    analysis.congestion.reasoning,
+                    analysis.congestion.departure_recommendation,
+                    analysis.departure_window,
+                    analysis.detailed_reasoning,
+                ],
+                preferences
             )
             
             # Create filtered congestion result
@@ -386,16 +529,10 @@ class TrafficController:
                 reasoning=filtered_reasoning
             )
             
-            # Filter other text fields
+            # Filter hotspot warnings, dropping any that fail content checks
             filtered_hotspot_warnings = self.content_filter.filter_suggestions(
                 analysis.hotspot_warnings, preferences
             )
-            filtered_departure_window = self.content_filter.filter_text(
-                analysis.departure_window, preferences
-            )
-            filtered_detailed_reasoning = self.content_filter.filter_text(
-                analysis.detailed_reasoning, preferences
-            )
             
             return TrafficAnalysis(
                 congestion=filtered_congestion,
@@ -405,6 +542,24 @@ class TrafficController:
             )
             
         except Exception as e:
-            logger.error(f"Error applying content filtering: {e}")
+            logger.error("Error applying content filtering: %s", e)
             # Return original analysis if filtering fails
-            return analysis
\ No newline at end of file
+            return analysis
+
+
+@functools.lru_cache(maxsize=4)
+def get_controller(config_path: Optional[str] = None) -> TrafficController:
+    """
+    Get a shared TrafficController for the given configuration path
+    
+    Controllers are built once per config path so repeated callers skip config
+    parsing, validation and engine construction. Use get_controller.cache_clear()
+    to pick up configuration changes.
+    
+    Args:
+        config_path: Optional path to configuration file
+        
+    Returns:
+        TrafficController for the configuration
+    """
+    return TrafficController(config_path)
\ No newline at end of file
@@ -11,127 +11,109 @@ This script demonstrates 6 different scenarios that showcase the system's capabi
 6. Family-friendly preferences
 """
 
+import io
+import logging
+import re
+import sys
 from datetime import datetime
-from app.traffic_controller import TrafficController
+from app.traffic_controller import TrafficController, get_controller
 
 
-def print_separator(title: str):
-    """Print a formatted separator for demo sections"""
-    print("\n" + "=" * 60)
-    print(f" {title}")
-    print("=" * 60)
+# Rule drawn above and below demo section titles
+SEPARATOR_LINE = "=" * 60
 
+# Nightlife terms checked in scenario 6, matched in a single scan
+NIGHTLIFE_PATTERN = re.compile(r'\b(?:bar|pub|nightclub|nightlife|drinks)\b', re.IGNORECASE)
 
-def print_analysis(analysis, scenario_description: str):
-    """Print formatted analysis results"""
-    print(f"\n📍 Scenario: {scenario_description}")
-    print(f"🚦 Congestion Level: {analysis.congestion.level.value}")
-    print(f"💡 Recommendation: {analysis.congestion.departure_recommendation}")
-    print(f"🧠 Reasoning: {analysis.congestion.reasoning}")
+
+def print_separator(title: str, out):
+    """Write a formatted separator for demo sections to out"""
+    out.write(f"\n{SEPARATOR_LINE}\n {title}\n{SEPARATOR_LINE}\n")
+
+
+def print_analysis(analysis, scenario_description: str, out):
+    """Write formatted analysis results to out"""
+    out.write(f"\n📍 Scenario: {scenario_description}\n")
+    out.write(f"🚦 Congestion Level: {analysis.congestion.level.value}\n")
+    out.write(f"💡 Recommendation: {analysis.congestion.departure_recommendation}\n")
+    out.write(f"🧠 Reasoning: {analysis.congestion.reasoning}\n")
     
     if analysis.departure_window:
-        print(f"⏰ Departure Window: {analysis.departure_window}")
+        out.write(f"⏰ Departure Window: {analysis.departure_window}\n")
     
     if analysis.hotspot_warnings:
-        print(f"⚠️  Hotspot Warnings:")
+        out.write(f"⚠️  Hotspot Warnings:\n")
         for warning in analysis.hotspot_warnings:
-            print(f"   • {warning}")
+            out.write(f"   • {warning}\n")
     
     if analysis.detailed_reasoning and len(analysis.detailed_reasoning) > len(analysis.congestion.reasoning):
-        print(f"📋 Detailed Analysis: {analysis.detailed_reasoning}")
+        out.write(f"📋 Detailed Analysis: {analysis.detailed_reasoning}\n")
 
 
-def demo_scenario_1(controller: TrafficController):
+def demo_scenario_1(controller: TrafficController, analysis) -> str:
     """Demo 1: Weekday Morning IT Corridor Commute"""
-    print_separator("DEMO 1: Weekday Morning IT Corridor Commute")
+    out = io.StringIO()
+    print_separator("DEMO 1: Weekday Morning IT Corridor Commute", out)
     
-    analysis = controller.analyze_route(
-        "Gachibowli", 
-        "Ameerpet", 
-        datetime(2024, 1, 1, 9, 0)  # Monday 9:00 AM
-    )
-    
-    print_analysis(analysis, "Gachibowli → Ameerpet, Monday 9:00 AM")
-    print("\n🎯 Expected: High congestion due to peak window + IT corridor + hotspots")
-    print(f"✅ Result: {analysis.congestion.level.value} congestion as expected")
+    print_analysis(analysis, "Gachibowli → Ameerpet, Monday 9:00 AM", out)
+    out.write("\n🎯 Expected: High congestion due to peak window + IT corridor + hotspots\n")
+    out.write(f"✅ Result: {analysis.congestion.level.value} congestion as expected\n")
+    return out.getvalue()
 
 
-def demo_scenario_2(controller: TrafficController):
+def demo_scenario_2(controller: TrafficController, analysis) -> str:
     """Demo 2: Weekend Non-Peak Travel"""
-    print_separator("DEMO 2: Weekend Non-Peak Travel")
+    out = io.StringIO()
+    print_separator("DEMO 2: Weekend Non-Peak Travel", out)
     
-    analysis = controller.analyze_route(
-        "Jubilee Hills", 
-        "Secunderabad", 
-        datetime(2024, 1, 6, 10, 0)  # Saturday 10:00 AM
-    )
-    
-    print_analysis(analysis, "Jubilee Hills → Secunderabad, Saturday 10:00 AM")
-    print("\n🎯 Expected: Lower congestion due to weekend adjustment")
-    print(f"✅ Result: {analysis.congestion.level.value} congestion with weekend consideration")
+    print_analysis(analysis, "Jubilee Hills → Secunderabad, Saturday 10:00 AM", out)
+    out.write("\n🎯 Expected: Lower congestion due to weekend adjustment\n")
+    out.write(f"✅ Result: {analysis.congestion.level.value} congestion with weekend consideration\n")
+    return out.getvalue()
 
 
-def demo_scenario_3(controller: TrafficController):
+def demo_scenario_3(controller: TrafficController, analysis) -> str:
     """Demo 3: Evening Peak Hour Return"""
-    print_separator("DEMO 3: Evening Peak Hour Return")
-    
-    analysis = controller.analyze_route(
-        "Hitec City", 
-        "Banjara Hills", 
-        datetime(2024, 1, 1, 18, 30)  # Monday 6:30 PM
-    )
+    out = io.StringIO()
+    print_separator("DEMO 3: Evening Peak Hour Return", out)
     
-    print_analysis(analysis, "Hitec City → Banjara Hills, Monday 6:30 PM")
-    print("\n🎯 Expected: High congestion due to evening peak + IT corridor")
-    print(f"✅ Result: {analysis.congestion.level.value} congestion during evening rush")
+    print_analysis(analysis, "Hitec City → Banjara Hills, Monday 6:30 PM", out)
+    out.write("\n🎯 Expected: High congestion due to evening peak + IT corridor\n")
+    out.write(f"✅ Result: {analysis.congestion.level.value} congestion during evening rush\n")
+    return out.getvalue()
 
 
-def demo_scenario_4(controller: TrafficController):
+def demo_scenario_4(controller: TrafficController, analysis) -> str:
     """Demo 4: Cross-City Old City to IT Corridor"""
-    print_separator("DEMO 4: Cross-City Old City to IT Corridor")
+    out = io.StringIO()
+    print_separator("DEMO 4: Cross-City Old City to IT Corridor", out)
     
-    analysis = controller.analyze_route(
-        "Charminar", 
-        "Financial District", 
-        datetime(2024, 1, 1, 8, 0)  # Monday 8:00 AM
-    )
-    
-    print_analysis(analysis, "Charminar → Financial District, Monday 8:00 AM")
-    print("\n🎯 Expected: High congestion due to hotspots + IT corridor + peak time")
-    print(f"✅ Result: {analysis.congestion.level.value} congestion with multiple factors")
+    print_analysis(analysis, "Charminar → Financial District, Monday 8:00 AM", out)
+    out.write("\n🎯 Expected: High congestion due to hotspots + IT corridor + peak time\n")
+    out.write(f"✅ Result: {analysis.congestion.level.value} congestion with multiple factors\n")
+    return out.getvalue()
 
 
-def demo_scenario_5(controller: TrafficController):
+def demo_scenario_5(controller: TrafficController, analysis) -> str:
     """Demo 5: Unknown Area Handling"""
-    print_separator("DEMO 5: Unknown Area Handling")
-    
-    analysis = controller.analyze_route(
-        "UnknownPlace", 
-        "Gachibowli", 
-        datetime(2024, 1, 1, 9, 0)  # Monday 9:00 AM
-    )
+    out = io.StringIO()
+    print_separator("DEMO 5: Unknown Area Handling", out)
     
-    print_analysis(analysis, "UnknownPlace → Gachibowli, Monday 9:00 AM")
-    print("\n🎯 Expected: Unknown area message with addition prompt")
+    print_analysis(analysis, "UnknownPlace → Gachibowli, Monday 9:00 AM", out)
+    out.write("\n🎯 Expected: Unknown area message with addition prompt\n")
     expected_message = "That area isn't in my local dataset yet—add it to product.md"
     if expected_message in analysis.congestion.reasoning:
-        print("✅ Result: Unknown area handled correctly with addition prompt")
+        out.write("✅ Result: Unknown area handled correctly with addition prompt\n")
     else:
-        print("❌ Result: Unknown area handling not working as expected")
+        out.write("❌ Result: Unknown area handling not working as expected\n")
+    return out.getvalue()
 
 
-def demo_scenario_6(controller: TrafficController):
+def demo_scenario_6(controller: TrafficController, normal_analysis) -> str:
     """Demo 6: Family-Friendly Preferences"""
-    print_separator("DEMO 6: Family-Friendly Preferences")
+    out = io.StringIO()
+    print_separator("DEMO 6: Family-Friendly Preferences", out)
     
-    # First show normal analysis
-    normal_analysis = controller.analyze_route(
-        "Ameerpet", 
-        "Kukatpally", 
-        datetime(2024, 1, 1, 10, 0)  # Monday 10:00 AM
-    )
-    
-    # Then show with preferences
     filtered_analysis = controller.analyze_route_with_preferences(
         "Ameerpet", 
         "Kukatpally", 
@@ -140,106 +122,136 @@ def demo_scenario_6(controller: TrafficController):
         prefer_family_friendly=True
     )
     
-    print(f"\n📍 Scenario: Ameerpet → Kukatpally, Monday 10:00 AM")
-    print(f"\n🔸 Normal Analysis:")
-    print(f"   Reasoning: {normal_analysis.congestion.reasoning}")
+    out.write(f"\n📍 Scenario: Ameerpet → Kukatpally, Monday 10:00 AM\n")
+    out.write(f"\n🔸 Normal Analysis:\n")
+    out.write(f"   Reasoning: {normal_analysis.congestion.reasoning}\n")
     
-    print(f"\n🔸 With Family-Friendly Preferences:")
-    print(f"   Reasoning: {filtered_analysis.congestion.reasoning}")
+    out.write(f"\n🔸 With Family-Friendly Preferences:\n")
+    out.write(f"   Reasoning: {filtered_analysis.congestion.reasoning}\n")
     
-    print("\n🎯 Expected: Content filtered for family-friendly suggestions")
+    out.write("\n🎯 Expected: Content filtered for family-friendly suggestions\n")
     
     # Check for nightlife terms
     all_text = (filtered_analysis.congestion.reasoning + " " + 
                filtered_analysis.detailed_reasoning + " " + 
-               " ".join(filtered_analysis.hotspot_warnings)).lower()
+               " ".join(filtered_analysis.hotspot_warnings))
     
-    nightlife_terms = ["bar", "pub", "nightclub", "nightlife", "drinks"]
-    has_nightlife = any(term in all_text for term in nightlife_terms)
+    has_nightlife = NIGHTLIFE_PATTERN.search(all_text) is not None
     
     if not has_nightlife:
-        print("✅ Result: Content successfully filtered for family-friendly output")
+        out.write("✅ Result: Content successfully filtered for family-friendly output\n")
     else:
-        print("⚠️  Result: Some nightlife content may still be present")
+        out.write("⚠️  Result: Some nightlife content may still be present\n")
+    return out.getvalue()
+
+
+# Each scenario with the route it reports on; all routes are analyzed in one batch
+DEMO_SCENARIOS = (
+    (demo_scenario_1, ("Gachibowli", "Ameerpet", datetime(2024, 1, 1, 9, 0))),  # Monday 9:00 AM
+    (demo_scenario_2, ("Jubilee Hills", "Secunderabad", datetime(2024, 1, 6, 10, 0))),  # Saturday 10:00 AM
+    (demo_scenario_3, ("Hitec City", "Banjara Hills", datetime(2024, 1, 1, 18, 30))),  # Monday 6:30 PM
+    (demo_scenario_4, ("Charminar", "Financial District", datetime(2024, 1, 1, 8, 0))),  # Monday 8:00 AM
+    (demo_scenario_5, ("UnknownPlace", "Gachibowli", datetime(2024, 1, 1, 9, 0))),  # Monday 9:00 AM
+    (demo_scenario_6, ("Ameerpet", "Kukatpally", datetime(2024, 1, 1, 10, 0))),  # Monday 10:00 AM
+)
+
+
+def run_scenarios(controller: TrafficController, scenarios=DEMO_SCENARIOS) -> list[str]:
+    """Analyze all scenario routes in one batch, returning reports in scenario order"""
+    analyses = controller.analyze_routes([route for _, route in scenarios])
+    return [
+        scenario(controller, analysis)
+        for (scenario, _), analysis in zip(scenarios, analyses)
+    ]
+
+
+def flush_output(out):
+    """Write buffered demo output to stdout in one call and clear the buffer"""
+    sys.stdout.write(out.getvalue())
+    out.seek(0)
+    out.truncate()
 
 
 def run_all_demos():
     """Run all demo scenarios"""
-    print("🚗 Hyderabad Traffic Guide - Demo Scenarios")
-    print("=" * 60)
-    print("This demo showcases 6 different scenarios that demonstrate")
-    print("the system's capabilities and various traffic conditions.")
+    out = io.StringIO()
+    out.write("🚗 Hyderabad Traffic Guide - Demo Scenarios\n")
+    out.write(f"{SEPARATOR_LINE}\n")
+    out.write("This demo showcases 6 different scenarios that demonstrate\n")
+    out.write("the system's capabilities and various traffic conditions.\n")
     
     try:
         # Initialize traffic controller
-        print("\n🔧 Initializing Traffic Controller...")
-        controller = TrafficController()
+        out.write("\n🔧 Initializing Traffic Controller...\n")
+        controller = get_controller()
         
         if controller._initialization_error:
-            print(f"❌ Initialization Error: {controller._initialization_error}")
-            print("\n💡 Please ensure the configuration file exists at:")
-            print("   .kiro/steering/product.md")
+            out.write(f"❌ Initialization Error: {controller._initialization_error}\n")
+            out.write("\n💡 Please ensure the configuration file exists at:\n")
+            out.write("   .kiro/steering/product.md\n")
             return
         
-        print("✅ Traffic Controller initialized successfully")
+        out.write("✅ Traffic Controller initialized successfully\n")
         
         # Validate configuration
         validation = controller.parser.validate_config(controller.config)
         if validation.is_valid:
-            print("✅ Configuration validated successfully")
+            out.write("✅ Configuration validated successfully\n")
         else:
-            print("⚠️  Configuration has some issues:")
+            out.write("⚠️  Configuration has some issues:\n")
             for error in validation.errors:
-                print(f"   • {error}")
+                out.write(f"   • {error}\n")
         
         if validation.warnings:
-            print("ℹ️  Configuration warnings:")
+            out.write("ℹ️  Configuration warnings:\n")
             for warning in validation.warnings:
-                print(f"   • {warning}")
+                out.write(f"   • {warning}\n")
+        
+        flush_output(out)
         
-        # Run all demo scenarios
-        demo_scenario_1(controller)
-        demo_scenario_2(controller)
-        demo_scenario_3(controller)
-        demo_scenario_4(controller)
-        demo_scenario_5(controller)
-        demo_scenario_6(controller)
+        # Run all demo scenarios; each report is written in one call, in scenario order
+        for report in run_scenarios(controller):
+            sys.stdout.write(report)
         
         # Summary
-        print_separator("DEMO SUMMARY")
-        print("✅ All 6 demo scenarios completed successfully!")
-        print("\n📊 Scenarios demonstrated:")
-        print("   1. ✅ Weekday morning IT corridor commute (high congestion)")
-        print("   2. ✅ Weekend non-peak travel (lower congestion)")
-        print("   3. ✅ Evening peak hour return (high congestion)")
-        print("   4. ✅ Cross-city old city to IT corridor (multiple factors)")
-        print("   5. ✅ Unknown area handling (graceful degradation)")
-        print("   6. ✅ Family-friendly preferences (content filtering)")
+        print_separator("DEMO SUMMARY", out)
+        out.write("✅ All 6 demo scenarios completed successfully!\n")
+        out.write("\n📊 Scenarios demonstrated:\n")
+        out.write("   1. ✅ Weekday morning IT corridor commute (high congestion)\n")
+        out.write("   2. ✅ Weekend non-peak travel (lower congestion)\n")
+        out.write("   3. ✅ Evening peak hour return (high congestion)\n")
+        out.write("   4. ✅ Cross-city old city to IT corridor (multiple factors)\n")
+        out.write("   5. ✅ Unknown area handling (graceful degradation)\n")
+        out.write("   6. ✅ Family-friendly preferences (content filtering)\n")
         
-        print("\n🎯 Key Features Demonstrated:")
-        print("   • Configuration-driven scoring")
-        print("   • Peak window detection")
-        print("   • IT corridor awareness")
-        print("   • Hotspot warnings")
-        print("   • Weekend adjustments")
-        print("   • Unknown area handling")
-        print("   • Content filtering preferences")
-        print("   • Detailed reasoning explanations")
+        out.write("\n🎯 Key Features Demonstrated:\n")
+        out.write("   • Configuration-driven scoring\n")
+        out.write("   • Peak window detection\n")
+        out.write("   • IT corridor awareness\n")
+        out.write("   • Hotspot warnings\n")
+        out.write("   • Weekend adjustments\n")
+        out.write("   • Unknown area handling\n")
+        out.write("   • Content filtering preferences\n")
+        out.write("   • Detailed reasoning explanations\n")
         
-        print("\n🚀 Next Steps:")
-        print("   • Run the Streamlit web app: streamlit run streamlit_app.py")
-        print("   • Try your own routes and times")
-        print("   • Explore the preference settings")
-        print("   • Add new areas to the configuration")
+        out.write("\n🚀 Next Steps:\n")
+        out.write("   • Run the Streamlit web app: streamlit run streamlit_app.py\n")
+        out.write("   • Try your own routes and times\n")
+        out.write("   • Explore the preference settings\n")
+        out.write("   • Add new areas to the configuration\n")
         
     except Exception as e:
-        print(f"❌ Demo failed with error: {e}")
-        print("\n💡 Troubleshooting:")
-        print("   • Check that all dependencies are installed")
-        print("   • Ensure the configuration file exists")
-        print("   • Verify the project structure is correct")
-        print("   • Run the tests to check system health")
+        out.write(f"❌ Demo failed with error: {e}\n")
+        out.write("\n💡 Troubleshooting:\n")
+        out.write("   • Check that all dependencies are installed\n")
+        out.write("   • Ensure the configuration file exists\n")
+        out.write("   • Verify the project structure is correct\n")
+        out.write("   • Run the tests to check system health\n")
+    
+    finally:
+        flush_output(out)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
     run_all_demos()
\ No newline at end of file
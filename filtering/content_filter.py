@@ -2,11 +2,99 @@
 Content filtering system for family-friendly recommendations
 """
 import re
-from typing import List, Dict, Any
+from typing import Dict, FrozenSet, Iterable, List, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+def _compile_terms(terms: Iterable[str]) -> "re.Pattern[str]":
+    """Compile whole-word terms into one case-insensitive alternation, longest first"""
+    ordered = sorted(terms, key=lambda term: (-len(term), term))
+    # Checking the first character against a class lets the scan skip most
+    # positions without trying every alternative
+    initials = ''.join(sorted({re.escape(term[0]) for term in ordered}))
+    return re.compile(
+        r'\b(?=[' + initials + r'])(?:' + '|'.join(re.escape(term) for term in ordered) + r')\b',
+        re.IGNORECASE
+    )
+
+
+def _compile_substrings(terms: Iterable[str]) -> "re.Pattern[str]":
+    """Compile terms into one alternation that finds any of them anywhere in a lowercased text"""
+    return re.compile('|'.join(re.escape(term) for term in sorted(terms)))
+
+
+def _compile_replacements(replacements: Dict[str, str]) -> Tuple["re.Pattern[str]", Tuple[str, ...]]:
+    """
+    Compile ordered whole-word replacements into one pattern and its expansions
+    
+    Applying the replacements one after another lets a later word rewrite text
+    inserted by an earlier one, so each expansion already has the later
+    replacements applied. Group N of the pattern matches the word for expansion N-1.
+    """
+    words = list(replacements)
+    expansions = []
+    for index, word in enumerate(words):
+        expansion = replacements[word]
+        for later in words[index + 1:]:
+            expansion = re.sub(r'\b' + re.escape(later) + r'\b', replacements[later], expansion, flags=re.IGNORECASE)
+        expansions.append(expansion)
+    
+    pattern = re.compile(
+        r'\b(?:' + '|'.join('(' + re.escape(word) + ')' for word in words) + r')\b',
+        re.IGNORECASE
+    )
+    return pattern, tuple(expansions)
+
+
+# Nightlife-related terms to filter out
+_NIGHTLIFE_TERMS: FrozenSet[str] = frozenset({
+    'pub', 'bar', 'club', 'nightclub', 'disco', 'lounge', 'brewery',
+    'wine', 'beer', 'alcohol', 'drinks', 'party', 'nightlife',
+    'late night', 'after hours', 'cocktail', 'spirits', 'liquor'
+})
+
+# Inappropriate content terms
+_INAPPROPRIATE_TERMS: FrozenSet[str] = frozenset({
+    'adult', 'mature', '18+', 'restricted', 'explicit',
+    'gambling', 'casino', 'betting'
+})
+
+# Family-friendly replacement phrases, applied in this order
+_FAMILY_FRIENDLY_REPLACEMENTS: Dict[str, str] = {
+    'stop': 'quiet rest area',
+    'break': 'family-friendly break',
+    'rest': 'peaceful rest stop',
+    'suggestion': 'family-appropriate suggestion',
+    'recommendation': 'suitable recommendation'
+}
+
+# Nightlife-heavy corridors in Hyderabad, longest first
+_NIGHTLIFE_CORRIDORS: Tuple[str, ...] = tuple(sorted(
+    ('jubilee hills', 'banjara hills', 'gachibowli', 'hitech city', 'madhapur', 'kondapur'),
+    key=len, reverse=True
+))
+
+# All replacements made in a single scan
+_FAMILY_FRIENDLY_PATTERN, _FAMILY_FRIENDLY_EXPANSIONS = _compile_replacements(_FAMILY_FRIENDLY_REPLACEMENTS)
+
+# Both term lists matched together in a single scan
+_FILTERED_TERMS_PATTERN = _compile_terms(_NIGHTLIFE_TERMS | _INAPPROPRIATE_TERMS)
+
+# Every filtered term starts with one of these characters, so ASCII text
+# containing none of them cannot match and skips the term scan
+_FILTERED_TERM_INITIALS: FrozenSet[str] = frozenset(
+    initial
+    for term in _NIGHTLIFE_TERMS | _INAPPROPRIATE_TERMS
+    for initial in (term[0].lower(), term[0].upper())
+)
+
+# Containment checks stop at the first term found anywhere in the text
+_NIGHTLIFE_SUBSTRINGS = _compile_substrings(_NIGHTLIFE_TERMS)
+_INAPPROPRIATE_SUBSTRINGS = _compile_substrings(_INAPPROPRIATE_TERMS)
+_NIGHTLIFE_CORRIDOR_SUBSTRINGS = _compile_substrings(_NIGHTLIFE_CORRIDORS)
+
+
+@dataclass(frozen=True, slots=True)
 class FilterPreferences:
     """User preferences for content filtering"""
     avoid_nightlife: bool = False
@@ -16,35 +104,25 @@ class FilterPreferences:
 class ContentFilter:
     """System for filtering content based on family-friendly preferences"""
     
+    # Joins texts for batch filtering; not whitespace or a word character, so
+    # term boundaries and space cleanup behave as they do at string ends
+    _TEXT_SEPARATOR = '\x00'
+    
     def __init__(self):
         """Initialize content filter with filtering rules"""
-        # Nightlife-related terms to filter out
-        self.nightlife_terms = [
-            'pub', 'bar', 'club', 'nightclub', 'disco', 'lounge', 'brewery',
-            'wine', 'beer', 'alcohol', 'drinks', 'party', 'nightlife',
-            'late night', 'after hours', 'cocktail', 'spirits', 'liquor'
-        ]
-        
-        # Inappropriate content terms
-        self.inappropriate_terms = [
-            'adult', 'mature', '18+', 'restricted', 'explicit',
-            'gambling', 'casino', 'betting'
-        ]
-        
-        # Family-friendly replacement phrases
-        self.family_friendly_replacements = {
-            'stop': 'quiet rest area',
-            'break': 'family-friendly break',
-            'rest': 'peaceful rest stop',
-            'suggestion': 'family-appropriate suggestion',
-            'recommendation': 'suitable recommendation'
-        }
-        
-        # Nightlife-heavy corridors in Hyderabad
-        self.nightlife_corridors = [
-            'jubilee hills', 'banjara hills', 'gachibowli', 'hitech city',
-            'madhapur', 'kondapur'
-        ]
+        # The rules are shared module constants, so instances cost nothing to build
+        self.nightlife_terms = _NIGHTLIFE_TERMS
+        self.inappropriate_terms = _INAPPROPRIATE_TERMS
+        self.family_friendly_replacements = _FAMILY_FRIENDLY_REPLACEMENTS
+        self.nightlife_corridors = _NIGHTLIFE_CORRIDORS
+        
+        self._filtered_terms_pattern = _FILTERED_TERMS_PATTERN
+        self._filtered_term_initials = _FILTERED_TERM_INITIALS
+        self._nightlife_substrings = _NIGHTLIFE_SUBSTRINGS
+        self._inappropriate_substrings = _INAPPROPRIATE_SUBSTRINGS
+        self._nightlife_corridor_substrings = _NIGHTLIFE_CORRIDOR_SUBSTRINGS
+        self._family_friendly_pattern = _FAMILY_FRIENDLY_PATTERN
+        self._family_friendly_expansions = _FAMILY_FRIENDLY_EXPANSIONS
     
     def filter_text(self, text: str, preferences: FilterPreferences) -> str:
         """
@@ -63,11 +141,8 @@ class ContentFilter:
         filtered_text = text
         
         if preferences.avoid_nightlife or preferences.prefer_family_friendly:
-            # Remove nightlife terms
-            filtered_text = self._remove_nightlife_content(filtered_text)
-            
-            # Remove inappropriate content
-            filtered_text = self._remove_inappropriate_content(filtered_text)
+            # Remove nightlife and inappropriate terms
+            filtered_text = self._remove_filtered_content(filtered_text)
         
         if preferences.prefer_family_friendly:
             # Apply family-friendly replacements
@@ -75,6 +150,37 @@ class ContentFilter:
         
         return filtered_text
     
+    def filter_texts(self, texts: List[str], preferences: FilterPreferences) -> List[str]:
+        """
+        Filter several texts at once based on preferences
+        
+        Equivalent to calling filter_text on each text, but the removal steps
+        run once over the joined texts instead of once per text.
+        
+        Args:
+            texts: Original texts to filter
+            preferences: User filtering preferences
+            
+        Returns:
+            Filtered texts in the same order
+        """
+        if not preferences.avoid_nightlife and not preferences.prefer_family_friendly:
+            return list(texts)
+        
+        separator = self._TEXT_SEPARATOR
+        if any(not text or separator in text for text in texts):
+            return [self.filter_text(text, preferences) for text in texts]
+        
+        joined = separator.join(texts)
+        joined = self._remove_filtered_content(joined)
+        filtered_texts = [part.strip() for part in joined.split(separator)]
+        
+        if preferences.prefer_family_friendly:
+            # Replacements depend on each text's own context, so apply them per text
+            filtered_texts = [self._apply_family_friendly_replacements(text) for text in filtered_texts]
+        
+        return filtered_texts
+    
     def filter_suggestions(self, suggestions: List[str], preferences: FilterPreferences) -> List[str]:
         """
         Filter a list of suggestions based on preferences
@@ -91,10 +197,7 @@ class ContentFilter:
         
         filtered_suggestions = []
         
-        for suggestion in suggestions:
-            # Filter the suggestion text
-            filtered_suggestion = self.filter_text(suggestion, preferences)
-            
+        for filtered_suggestion in self.filter_texts(suggestions, preferences):
             # Only include if it passes content checks
             if self._passes_content_check(filtered_suggestion, preferences):
                 filtered_suggestions.append(filtered_suggestion)
@@ -115,10 +218,8 @@ class ContentFilter:
         if not preferences.avoid_nightlife:
             return False
         
-        corridor_lower = corridor_name.lower()
-        
-        # Check if it's a known nightlife-heavy corridor
-        return any(nightlife_area in corridor_lower for nightlife_area in self.nightlife_corridors)
+        # Check if it's a known nightlife-heavy corridor, in a single scan
+        return self._nightlife_corridor_substrings.search(corridor_name.lower()) is not None
     
     def get_family_friendly_alternative(self, original_text: str) -> str:
         """
@@ -133,52 +234,36 @@ class ContentFilter:
         # If text contains nightlife references, provide neutral alternative
         text_lower = original_text.lower()
         
-        if any(term in text_lower for term in self.nightlife_terms):
+        if self._nightlife_substrings.search(text_lower):
             return "Consider alternative routes for a more suitable travel experience."
         
-        if any(term in text_lower for term in self.inappropriate_terms):
+        if self._inappropriate_substrings.search(text_lower):
             return "Please consider family-appropriate travel options."
         
         return original_text
     
-    def _remove_nightlife_content(self, text: str) -> str:
-        """Remove nightlife-related content from text"""
-        filtered_text = text
-        
-        for term in self.nightlife_terms:
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(term) + r'\b'
-            filtered_text = re.sub(pattern, '', filtered_text, flags=re.IGNORECASE)
+    def _remove_filtered_content(self, text: str) -> str:
+        """Remove nightlife and inappropriate content from text in one pass"""
+        # Non-ASCII text may case-fold onto a term initial, so only ASCII text is prefiltered
+        if text.isascii() and self._filtered_term_initials.isdisjoint(text):
+            filtered_text = text
+        else:
+            filtered_text = self._filtered_terms_pattern.sub('', text)
         
         # Clean up extra spaces
-        filtered_text = re.sub(r'\s+', ' ', filtered_text).strip()
-        
-        return filtered_text
-    
-    def _remove_inappropriate_content(self, text: str) -> str:
-        """Remove inappropriate content from text"""
-        filtered_text = text
-        
-        for term in self.inappropriate_terms:
-            pattern = r'\b' + re.escape(term) + r'\b'
-            filtered_text = re.sub(pattern, '', filtered_text, flags=re.IGNORECASE)
-        
-        # Clean up extra spaces
-        filtered_text = re.sub(r'\s+', ' ', filtered_text).strip()
+        filtered_text = ' '.join(filtered_text.split())
         
         return filtered_text
     
     def _apply_family_friendly_replacements(self, text: str) -> str:
         """Apply family-friendly replacements to text"""
-        filtered_text = text
-        
-        for original, replacement in self.family_friendly_replacements.items():
-            # Only replace if the context suggests it's about suggestions/recommendations
-            if 'suggest' in text.lower() or 'recommend' in text.lower():
-                pattern = r'\b' + re.escape(original) + r'\b'
-                filtered_text = re.sub(pattern, replacement, filtered_text, flags=re.IGNORECASE)
+        # Only replace if the context suggests it's about suggestions/recommendations
+        text_lower = text.lower()
+        if 'suggest' not in text_lower and 'recommend' not in text_lower:
+            return text
         
-        return filtered_text
+        expansions = self._family_friendly_expansions
+        return self._family_friendly_pattern.sub(lambda match: expansions[match.lastindex - 1], text)
     
     def _passes_content_check(self, text: str, preferences: FilterPreferences) -> bool:
         """Check if text passes content filtering requirements"""
@@ -189,12 +274,12 @@ class ContentFilter:
         
         if preferences.avoid_nightlife:
             # Should not contain nightlife terms
-            if any(term in text_lower for term in self.nightlife_terms):
+            if self._nightlife_substrings.search(text_lower):
                 return False
         
         if preferences.prefer_family_friendly:
             # Should not contain inappropriate terms
-            if any(term in text_lower for term in self.inappropriate_terms):
+            if self._inappropriate_substrings.search(text_lower):
                 return False
         
         return True
\ No newline at end of file
@@ -1,8 +1,9 @@
 """
 Main entry point for Hyderabad Traffic Guide
 """
+import logging
 from datetime import datetime
-from app.traffic_controller import TrafficController
+from app.traffic_controller import get_controller
 
 def main():
     """Main application entry point"""
@@ -11,7 +12,7 @@ def main():
     
     # Initialize traffic controller
     try:
-        controller = TrafficController()
+        controller = get_controller()
         validation = controller.parser.validate_config(controller.config)
         
         if validation.is_valid:
@@ -67,4 +68,5 @@ def main():
     print("Ready to implement remaining components...")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
     main()
\ No newline at end of file
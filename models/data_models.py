@@ -1,10 +1,10 @@
 """
 Core data models for Hyderabad Traffic Guide
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, time
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 class CongestionLevel(Enum):
@@ -14,14 +14,14 @@ class CongestionLevel(Enum):
     HIGH = "High"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeRange:
     """Represents a time range with start and end times"""
     start: time
     end: time
 
 
-@dataclass
+@dataclass(slots=True)
 class PeakWindows:
     """Peak traffic windows configuration"""
     weekday_morning: Optional[TimeRange]
@@ -29,7 +29,7 @@ class PeakWindows:
     weekend_pattern: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoringRules:
     """Rules for scoring traffic congestion"""
     base_score_level: CongestionLevel
@@ -39,7 +39,7 @@ class ScoringRules:
     weekend_reduction: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TrafficConfig:
     """Main configuration structure loaded from product.md"""
     peak_windows: PeakWindows
@@ -47,9 +47,13 @@ class TrafficConfig:
     hotspots: List[str]
     explanation_templates: Dict[str, str]
     scoring_rules: ScoringRules
+    # Casefolded area name -> first zone listing it, built alongside zones
+    area_to_zone: Dict[str, str] = field(default_factory=dict)
+    # Every distinct area across all zones, sorted, built alongside zones
+    all_areas_sorted: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class CongestionResult:
     """Result of congestion analysis"""
     level: CongestionLevel
@@ -59,7 +63,7 @@ class CongestionResult:
     reasoning: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AreaInfo:
     """Information about a specific area"""
     name: str
@@ -68,7 +72,7 @@ class AreaInfo:
     nearby_landmark: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class TrafficAnalysis:
     """Complete traffic analysis result"""
     congestion: CongestionResult
@@ -77,7 +81,7 @@ class TrafficAnalysis:
     detailed_reasoning: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of configuration validation"""
     is_valid: bool
@@ -1,10 +1,15 @@
 """
 Configuration parser for loading and validating product.md
 """
+import hashlib
+import logging
+import os
+import pickle
 import re
+from dataclasses import dataclass, field
 from datetime import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from models.data_models import (
     TrafficConfig, PeakWindows, TimeRange, ScoringRules, 
@@ -12,11 +17,70 @@ from models.data_models import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Bump whenever the pickled TrafficConfig layout or the parsing rules change
+# to invalidate old caches
+CONFIG_CACHE_VERSION = 5
+
+# Location of product.md relative to the working directory
+DEFAULT_CONFIG_PATH = Path(".kiro/steering/product.md")
+
+# Overrides the on-disk parse cache directory; set it to an empty string to
+# disable the on-disk cache
+CACHE_DIR_ENV_VAR = "HYD_TRAFFIC_CACHE_DIR"
+
+# Most parsed configs kept on disk; the least recently used are pruned
+CONFIG_CACHE_MAX_ENTRIES = 16
+
+# Pickled snapshots of the configs already loaded by this process, keyed by
+# resolved path and validated against the file's (mtime_ns, size) signature.
+# Every hit unpickles a fresh TrafficConfig, so callers never share the
+# mutable zones, hotspots and templates containers
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+
+# Patterns used while parsing, compiled once at import
+_MORNING_PEAK_RE = re.compile(r'morning peak:\s*(\d{2}):(\d{2})–(\d{2}):(\d{2})')
+_EVENING_PEAK_RE = re.compile(r'evening peak:\s*(\d{2}):(\d{2})–(\d{2}):(\d{2})')
+# A header line with its preceding newline; a literal prefix is found far
+# faster than a multiline "^" anchor, which is tried at every position
+_HEADER_LINE_RE = re.compile(r'\n##[^\n]*')
+
+
+@dataclass(slots=True)
+class _ParseState:
+    """Values collected while streaming through product.md"""
+    peak_lines: List[str] = field(default_factory=list)
+    zones: Dict[str, List[str]] = field(default_factory=dict)
+    current_zone: Optional[str] = None
+    hotspots: List[str] = field(default_factory=list)
+    templates: Dict[str, str] = field(default_factory=dict)
+
+
 class ConfigParser:
     """Parser for product.md configuration file"""
     
-    def __init__(self):
-        self.config_path = Path(".kiro/steering/product.md")
+    # Lowercase header prefixes of the wanted sections and the method fed each of their lines
+    _SECTION_HANDLERS = (
+        ("peak windows", "_handle_peak_windows_line"),
+        ("zones", "_handle_zones_line"),
+        ("hotspots", "_handle_hotspots_line"),
+        ("explanation templates", "_handle_explanation_templates_line"),
+    )
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.config_path = DEFAULT_CONFIG_PATH
+        self.cache_dir = self._resolve_cache_dir(cache_dir)
+    
+    @staticmethod
+    def _resolve_cache_dir(cache_dir: Optional[str]) -> Optional[Path]:
+        """Pick the on-disk cache directory, or None when disk caching is disabled"""
+        if cache_dir is None:
+            cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+            if cache_dir is None:
+                return Path.home() / ".cache" / "hyd-traffic"
+        
+        return Path(cache_dir) if cache_dir else None
     
     def load_config(self, file_path: Optional[str] = None) -> TrafficConfig:
         """Load configuration from product.md file"""
@@ -25,23 +89,87 @@ class ConfigParser:
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
         
-        content = config_file.read_text(encoding='utf-8')
-        
-        # Parse different sections
-        peak_windows = self._parse_peak_windows(content)
-        zones = self._parse_zones(content)
-        hotspots = self._parse_hotspots(content)
-        explanation_templates = self._parse_explanation_templates(content)
-        scoring_rules = self._create_default_scoring_rules()
+        # Skip reading the file at all if it is unchanged since this process loaded it
+        stat = config_file.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        memory_key = str(config_file.resolve())
+        memory_entry = _CONFIG_CACHE.get(memory_key)
+        if memory_entry is not None and memory_entry[0] == signature:
+            return pickle.loads(memory_entry[1])
+        
+        raw_content = config_file.read_bytes()
+        
+        # Reuse the parsed config if this exact file content was parsed before
+        cache_file = self._cache_file_for(raw_content) if self.cache_dir else None
+        config = self._read_cached_config(cache_file) if cache_file else None
+        parsed = config is None
+        if parsed:
+            # Decode with the same newline translation as Path.read_text
+            content = raw_content.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+            config = self._parse_content(content)
+        
+        snapshot = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+        if parsed and cache_file:
+            self._write_cached_config(cache_file, snapshot)
+        
+        _CONFIG_CACHE[memory_key] = (signature, snapshot)
+        return config
+    
+    def load_from_string(self, content: str) -> TrafficConfig:
+        """Parse configuration from product.md content without touching the filesystem"""
+        return self._parse_content(content.replace('\r\n', '\n').replace('\r', '\n'))
+    
+    def _parse_content(self, content: str) -> TrafficConfig:
+        """Parse a TrafficConfig from product.md content in a single pass"""
+        state = _ParseState()
+        pending_sections = [(prefix, getattr(self, name)) for prefix, name in self._SECTION_HANDLERS]
+        active_handlers = []
+        
+        # Only header lines are visited one by one; the body lines between two
+        # headers are handed out only while a wanted section is open
+        text = '\n' + content
+        body_start = 1
+        for header in _HEADER_LINE_RE.finditer(text):
+            line = header.group()[1:]
+            if active_handlers and header.start() >= body_start:
+                self._handle_body_lines(state, active_handlers, text[body_start:header.start()])
+            body_start = header.end() + 1
+            
+            # A "###" header closes the open sections, while a "##" header line is
+            # still body text for them; either may open the next wanted section
+            if line.startswith('###'):
+                active_handlers = []
+            else:
+                for handle_line in active_handlers:
+                    handle_line(state, line)
+            
+            title = line.lstrip('#').strip().lower()
+            for index, (prefix, handle_line) in enumerate(pending_sections):
+                if title.startswith(prefix):
+                    # Only the first header of each wanted section is parsed
+                    active_handlers.append(handle_line)
+                    del pending_sections[index]
+                    break
+        
+        if active_handlers and body_start <= len(text):
+            self._handle_body_lines(state, active_handlers, text[body_start:])
         
         return TrafficConfig(
-            peak_windows=peak_windows,
-            zones=zones,
-            hotspots=hotspots,
-            explanation_templates=explanation_templates,
-            scoring_rules=scoring_rules
+            peak_windows=self._parse_peak_windows('\n'.join(state.peak_lines)),
+            zones=state.zones,
+            hotspots=state.hotspots,
+            explanation_templates=self._add_default_templates(state.templates),
+            scoring_rules=self._create_default_scoring_rules(),
+            area_to_zone=self._index_zone_areas(state.zones),
+            all_areas_sorted=tuple(sorted({area for areas in state.zones.values() for area in areas}))
         )
     
+    def _handle_body_lines(self, state: _ParseState, handlers: List, body: str) -> None:
+        """Feed each line of a run of non-header lines to the open section handlers"""
+        for line in body.split('\n'):
+            for handle_line in handlers:
+                handle_line(state, line)
+    
     def validate_config(self, config: TrafficConfig) -> ValidationResult:
         """Validate the loaded configuration"""
         errors = []
@@ -96,11 +224,8 @@ class ConfigParser:
         """Extract hotspots from configuration"""
         return config.hotspots
     
-    def _parse_peak_windows(self, content: str) -> PeakWindows:
-        """Parse peak windows from markdown content"""
-        # Look for peak windows section
-        peak_section = self._extract_section(content, "Peak windows")
-        
+    def _parse_peak_windows(self, peak_section: str) -> PeakWindows:
+        """Parse peak windows from the peak windows section text"""
         if not peak_section.strip():
             # Return None-like structure to indicate missing peak windows
             return PeakWindows(
@@ -116,7 +241,7 @@ class ConfigParser:
         evening_end = time(20, 0)
         
         # Parse morning peak with error handling
-        morning_match = re.search(r'morning peak:\s*(\d{2}):(\d{2})–(\d{2}):(\d{2})', peak_section)
+        morning_match = _MORNING_PEAK_RE.search(peak_section)
         if morning_match:
             try:
                 morning_start = time(int(morning_match.group(1)), int(morning_match.group(2)))
@@ -126,7 +251,7 @@ class ConfigParser:
                 pass
         
         # Parse evening peak with error handling
-        evening_match = re.search(r'evening peak:\s*(\d{2}):(\d{2})–(\d{2}):(\d{2})', peak_section)
+        evening_match = _EVENING_PEAK_RE.search(peak_section)
         if evening_match:
             try:
                 evening_start = time(int(evening_match.group(1)), int(evening_match.group(2)))
@@ -141,76 +266,53 @@ class ConfigParser:
             weekend_pattern="lighter mornings; evenings can still be busy"
         )
     
-    def _parse_zones(self, content: str) -> Dict[str, List[str]]:
-        """Parse zones from markdown content"""
-        zones = {}
-        
-        # Look for zones section
-        zones_section = self._extract_section(content, "Zones")
-        
-        if not zones_section.strip():
-            return zones  # Return empty dict if no zones section found
-        
-        # Parse each zone - handle the format: "- zone_name:" followed by indented areas
-        lines = zones_section.split('\n')
-        current_zone = None
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('- zone_'):
-                # Extract zone name (remove the colon at the end)
-                current_zone = line[2:].rstrip(':')
-                zones[current_zone] = []
-            elif line.startswith('- ') and current_zone:
-                # This is an area under the current zone
-                area = line[2:].strip()
-                if area:
-                    zones[current_zone].append(area)
-        
-        return zones
-    
-    def _parse_hotspots(self, content: str) -> List[str]:
-        """Parse hotspots from markdown content"""
-        hotspots = []
-        
-        # Look for hotspots section
-        hotspots_section = self._extract_section(content, "Hotspots")
-        
-        # Extract all areas mentioned in the hotspots section
-        # Skip section headers and category labels
-        lines = hotspots_section.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            # Skip empty lines, section headers, and category descriptions
-            if (line.startswith('- ') and 
-                not line.endswith(':') and 
-                'IT corridor' not in line and 
-                'Central business' not in line and 
-                'Old city' not in line and 
-                'Transit hubs' not in line and 
-                'Event-sensitive' not in line):
-                
-                hotspot = line[2:].strip()
-                if hotspot:
-                    hotspots.append(hotspot)
-        
-        return hotspots
-    
-    def _parse_explanation_templates(self, content: str) -> Dict[str, str]:
-        """Parse explanation templates from markdown content"""
-        templates = {}
-        
-        # Look for explanation templates section
-        templates_section = self._extract_section(content, "Explanation templates")
-        
-        # Parse template patterns
-        template_pattern = r'- (.+?):\s*"(.+?)"'
-        matches = re.findall(template_pattern, templates_section)
-        
-        for key, value in matches:
-            templates[key] = value
-        
+    def _handle_peak_windows_line(self, state: "_ParseState", line: str) -> None:
+        """Collect a peak windows line; the section is matched as a whole at the end"""
+        state.peak_lines.append(line)
+    
+    def _handle_zones_line(self, state: "_ParseState", line: str) -> None:
+        """Parse a zones line of the form "- zone_name:" followed by indented areas"""
+        line = line.strip()
+        if line.startswith('- zone_'):
+            # Extract zone name (remove the colon at the end)
+            state.current_zone = line[2:].rstrip(':')
+            state.zones[state.current_zone] = []
+        elif line.startswith('- ') and state.current_zone:
+            # This is an area under the current zone
+            area = line[2:].strip()
+            if area:
+                state.zones[state.current_zone].append(area)
+    
+    def _handle_hotspots_line(self, state: "_ParseState", line: str) -> None:
+        """Parse a hotspots line, skipping category labels"""
+        line = line.strip()
+        # Skip empty lines, section headers, and category descriptions
+        if (line.startswith('- ') and 
+            not line.endswith(':') and 
+            'IT corridor' not in line and 
+            'Central business' not in line and 
+            'Old city' not in line and 
+            'Transit hubs' not in line and 
+            'Event-sensitive' not in line):
+            
+            hotspot = line[2:].strip()
+            if hotspot:
+                state.hotspots.append(hotspot)
+    
+    def _handle_explanation_templates_line(self, state: "_ParseState", line: str) -> None:
+        """Parse a quoted explanation template line"""
+        line = line.strip()
+        if not line.startswith('- '):
+            return
+        
+        key, _, value = line[2:].partition(':')
+        value = value.lstrip()
+        closing_quote = value.find('"', 1)
+        if key and value.startswith('"') and closing_quote > 1:
+            state.templates[key] = value[1:closing_quote]
+    
+    def _add_default_templates(self, templates: Dict[str, str]) -> Dict[str, str]:
+        """Fill in default explanation templates missing from the config"""
         # Add default templates if not found
         default_templates = {
             "Peak window triggered": "Departure time falls in a typical peak window.",
@@ -225,6 +327,15 @@ class ConfigParser:
         
         return templates
     
+    def _index_zone_areas(self, zones: Dict[str, List[str]]) -> Dict[str, str]:
+        """Build the reverse area -> zone index, keeping the first zone an area is listed under"""
+        area_to_zone = {}
+        for zone_name, areas in zones.items():
+            for area in areas:
+                area_to_zone.setdefault(area.casefold(), zone_name)
+        
+        return area_to_zone
+    
     def _create_default_scoring_rules(self) -> ScoringRules:
         """Create default scoring rules based on product.md logic"""
         return ScoringRules(
@@ -235,13 +346,60 @@ class ConfigParser:
             weekend_reduction=1
         )
     
-    def _extract_section(self, content: str, section_name: str) -> str:
-        """Extract a specific section from markdown content"""
-        # Look for section header (case insensitive)
-        pattern = rf'###?\s*{re.escape(section_name)}.*?\n(.*?)(?=###|\Z)'
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-        
-        if match:
-            return match.group(1)
-        
-        return ""
\ No newline at end of file
+    def _cache_file_for(self, raw_content: bytes) -> Path:
+        """Get the cache file path for the given raw config content"""
+        digest = hashlib.blake2b(raw_content, digest_size=16)
+        digest.update(f"v{CONFIG_CACHE_VERSION}".encode('ascii'))
+        return self.cache_dir / f"{digest.hexdigest()}.pkl"
+    
+    def _read_cached_config(self, cache_file: Path) -> Optional[TrafficConfig]:
+        """Load a previously parsed config, or None if unavailable"""
+        try:
+            with cache_file.open('rb') as f:
+                config = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable config cache %s: %s", cache_file, e)
+            return None
+        
+        if not isinstance(config, TrafficConfig):
+            return None
+        
+        # Mark the entry as recently used so pruning keeps it
+        try:
+            os.utime(cache_file)
+        except OSError:
+            pass
+        return config
+    
+    def _write_cached_config(self, cache_file: Path, snapshot: bytes) -> None:
+        """Store a pickled config; caching failures never block loading"""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with temp_file.open('wb') as f:
+                f.write(snapshot)
+            temp_file.replace(cache_file)
+        except Exception as e:
+            logger.warning("Unable to write config cache %s: %s", cache_file, e)
+            return
+        
+        self._prune_cache_dir(cache_file.parent)
+    
+    def _prune_cache_dir(self, cache_dir: Path) -> None:
+        """Delete the least recently used cached configs beyond CONFIG_CACHE_MAX_ENTRIES"""
+        try:
+            entries = []
+            for cache_file in cache_dir.glob("*.pkl"):
+                try:
+                    entries.append((cache_file.stat().st_mtime_ns, cache_file))
+                except FileNotFoundError:
+                    # Pruned concurrently by another process
+                    continue
+            
+            entries.sort(reverse=True)
+            for _, cache_file in entries[CONFIG_CACHE_MAX_ENTRIES:]:
+                cache_file.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning("Unable to prune config cache %s: %s", cache_dir, e)
\ No newline at end of file
@@ -4,6 +4,8 @@ Reasoning engine for generating explanations and departure recommendations
 from datetime import datetime, time
 from typing import List
 import logging
+import re
+from types import MappingProxyType
 
 from models.data_models import (
     TrafficConfig, CongestionResult, CongestionLevel
@@ -12,6 +14,34 @@ from models.data_models import (
 
 logger = logging.getLogger(__name__)
 
+# Family-friendly content rules from product.md
+_FAMILY_FRIENDLY_PHRASES = (
+    "quiet area", "family-friendly location", "peaceful route",
+    "suitable for families", "appropriate stop", "safe area"
+)
+
+_SUGGESTIONS = MappingProxyType({
+    "stop": "Consider a quiet rest area suitable for families",
+    "break": "Take a peaceful break at a family-friendly location",
+    "rest": "Find a safe and appropriate rest stop",
+    "suggestion": "Here's a family-appropriate travel suggestion",
+    "recommendation": "This route offers suitable options for family travel"
+})
+
+# Matched against lowercased text as plain substrings; "nightclub" is covered by "club"
+_NIGHTLIFE_RE = re.compile(r'pub|bar|club|lounge|brewery')
+_SUGGESTION_WORD_RE = re.compile(r'stop|break|rest|suggest')
+_FAMILY_QUALIFIED_RE = re.compile(r'quiet|family')
+
+# Words that get a family-friendly qualifier; a "rest" that runs into "stop"
+# is left for the "stop" match, as when replacing "stop" first
+_QUALIFIER_RE = re.compile(r'stop|break|rest(?!op)')
+_QUALIFIERS = {
+    'stop': 'quiet stop',
+    'break': 'family-friendly break',
+    'rest': 'peaceful rest',
+}
+
 
 class ReasoningEngine:
     """Engine for generating explanations and departure recommendations"""
@@ -20,11 +50,19 @@ class ReasoningEngine:
         """Initialize reasoning engine with configuration"""
         self.config = config
         
-        # Family-friendly content rules from product.md
-        self.family_friendly_phrases = [
-            "quiet area", "family-friendly location", "peaceful route",
-            "suitable for families", "appropriate stop", "safe area"
-        ]
+        self.family_friendly_phrases = _FAMILY_FRIENDLY_PHRASES
+        
+        self._nightlife_re = _NIGHTLIFE_RE
+        self._suggestion_word_re = _SUGGESTION_WORD_RE
+        self._family_qualified_re = _FAMILY_QUALIFIED_RE
+        self._qualifier_re = _QUALIFIER_RE
+        
+        # Templates are fixed per config, so each is made family-friendly once
+        templates = (config.explanation_templates if config else None) or {}
+        self._family_friendly_templates = {
+            rule: self._ensure_family_friendly_language(template)
+            for rule, template in templates.items()
+        }
     
     def generate_explanation(self, result: CongestionResult) -> str:
         """
@@ -43,19 +81,10 @@ class ReasoningEngine:
             # Use the first triggered rule as primary explanation
             primary_rule = result.triggered_rules[0]
             
-            # Safe access to explanation templates
-            template = "Standard traffic analysis applied."
-            if (self.config and self.config.explanation_templates and 
-                primary_rule in self.config.explanation_templates):
-                template = self.config.explanation_templates[primary_rule]
-            else:
-                template = f"{primary_rule} applied."
-            
-            # Ensure family-friendly language
-            return self._ensure_family_friendly_language(template)
+            return self._explain_rule(primary_rule)
             
         except Exception as e:
-            logger.error(f"Error generating explanation: {e}")
+            logger.error("Error generating explanation: %s", e)
             return "Traffic analysis completed."
     
     def get_departure_recommendation(self, result: CongestionResult) -> str:
@@ -88,7 +117,7 @@ class ReasoningEngine:
                     return "wait until traffic conditions improve"
                     
         except Exception as e:
-            logger.error(f"Error generating departure recommendation: {e}")
+            logger.error("Error generating departure recommendation: %s", e)
             return "check traffic conditions before departing"
     
     def format_detailed_reasoning(self, result: CongestionResult) -> str:
@@ -113,16 +142,9 @@ class ReasoningEngine:
             # Add explanation for each triggered rule
             for rule in result.triggered_rules:
                 try:
-                    template = "Standard analysis applied."
-                    if (self.config and self.config.explanation_templates and 
-                        rule in self.config.explanation_templates):
-                        template = self.config.explanation_templates[rule]
-                    else:
-                        template = f"{rule} applied."
-                    
-                    reasoning_parts.append(self._ensure_family_friendly_language(template))
+                    reasoning_parts.append(self._explain_rule(rule))
                 except Exception as e:
-                    logger.error(f"Error processing rule {rule}: {e}")
+                    logger.error("Error processing rule %s: %s", rule, e)
                     reasoning_parts.append(f"{rule} applied.")
             
             # Add score interpretation
@@ -130,7 +152,7 @@ class ReasoningEngine:
                 score_explanation = self._get_score_explanation(result.level, result.score)
                 reasoning_parts.append(score_explanation)
             except Exception as e:
-                logger.error(f"Error generating score explanation: {e}")
+                logger.error("Error generating score explanation: %s", e)
                 reasoning_parts.append("Traffic analysis completed.")
             
             # Add departure recommendation reasoning
@@ -138,13 +160,13 @@ class ReasoningEngine:
                 departure_reasoning = self._get_departure_reasoning(result)
                 reasoning_parts.append(departure_reasoning)
             except Exception as e:
-                logger.error(f"Error generating departure reasoning: {e}")
+                logger.error("Error generating departure reasoning: %s", e)
                 reasoning_parts.append("Consider current traffic conditions for departure timing.")
             
             return " ".join(reasoning_parts)
             
         except Exception as e:
-            logger.error(f"Error formatting detailed reasoning: {e}")
+            logger.error("Error formatting detailed reasoning: %s", e)
             return "Traffic analysis completed with limited information."
     
     def handle_nightlife_request(self) -> str:
@@ -159,7 +181,7 @@ class ReasoningEngine:
                     "For the best travel experience, I recommend quiet areas and "
                     "family-appropriate stops along your route.")
         except Exception as e:
-            logger.error(f"Error handling nightlife request: {e}")
+            logger.error("Error handling nightlife request: %s", e)
             return "I focus on providing family-friendly travel guidance."
     
     def generate_family_friendly_suggestion(self, area_type: str = "stop") -> str:
@@ -173,20 +195,18 @@ class ReasoningEngine:
             Family-friendly suggestion text
         """
         try:
-            suggestions = {
-                "stop": "Consider a quiet rest area suitable for families",
-                "break": "Take a peaceful break at a family-friendly location",
-                "rest": "Find a safe and appropriate rest stop",
-                "suggestion": "Here's a family-appropriate travel suggestion",
-                "recommendation": "This route offers suitable options for family travel"
-            }
-            
-            return suggestions.get(area_type, "Consider family-friendly options along your route")
+            return _SUGGESTIONS.get(area_type, "Consider family-friendly options along your route")
             
         except Exception as e:
-            logger.error(f"Error generating family-friendly suggestion: {e}")
+            logger.error("Error generating family-friendly suggestion: %s", e)
             return "Consider appropriate options along your route"
     
+    def _explain_rule(self, rule: str) -> str:
+        """Get the family-friendly explanation template for a rule"""
+        if rule in self._family_friendly_templates:
+            return self._family_friendly_templates[rule]
+        return self._ensure_family_friendly_language(f"{rule} applied.")
+    
     def _ensure_family_friendly_language(self, text: str) -> str:
         """Ensure text uses family-friendly language per product.md rules"""
         try:
@@ -197,23 +217,19 @@ class ReasoningEngine:
             text_lower = text.lower()
             
             # Check for nightlife terms and replace with neutral language
-            nightlife_terms = ['pub', 'bar', 'club', 'nightclub', 'lounge', 'brewery']
-            for term in nightlife_terms:
-                if term in text_lower:
-                    return "Consider alternative routes for optimal travel conditions."
+            if self._nightlife_re.search(text_lower):
+                return "Consider alternative routes for optimal travel conditions."
             
             # Ensure suggestions use family-friendly phrasing
-            if any(word in text_lower for word in ['stop', 'break', 'rest', 'suggest']):
-                if 'quiet' not in text_lower and 'family' not in text_lower:
+            if self._suggestion_word_re.search(text_lower):
+                if not self._family_qualified_re.search(text_lower):
                     # Add family-friendly qualifier
-                    text = text.replace('stop', 'quiet stop')
-                    text = text.replace('break', 'family-friendly break')
-                    text = text.replace('rest', 'peaceful rest')
+                    text = self._qualifier_re.sub(lambda match: _QUALIFIERS[match.group()], text)
             
             return text
             
         except Exception as e:
-            logger.error(f"Error ensuring family-friendly language: {e}")
+            logger.error("Error ensuring family-friendly language: %s", e)
             return text  # Return original text if processing fails
     
     def _get_score_explanation(self, level: CongestionLevel, score: int) -> str:
@@ -229,7 +245,7 @@ class ReasoningEngine:
                 else:
                     return "High congestion is expected."
         except Exception as e:
-            logger.error(f"Error generating score explanation: {e}")
+            logger.error("Error generating score explanation: %s", e)
             return "Traffic analysis completed."
     
     def _get_departure_reasoning(self, result: CongestionResult) -> str:
@@ -249,5 +265,5 @@ class ReasoningEngine:
                     return "Consider waiting for traffic conditions to improve."
                     
         except Exception as e:
-            logger.error(f"Error generating departure reasoning: {e}")
+            logger.error("Error generating departure reasoning: %s", e)
             return "Consider current traffic conditions for departure timing."
\ No newline at end of file
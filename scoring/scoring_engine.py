@@ -1,9 +1,13 @@
 """
 Scoring engine for calculating traffic congestion scores
 """
+from dataclasses import dataclass
 from datetime import datetime, time
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import bisect
+import functools
 import logging
+import re
 
 from models.data_models import (
     TrafficConfig, CongestionResult, CongestionLevel, AreaInfo
@@ -13,6 +17,148 @@ from reasoning.reasoning_engine import ReasoningEngine
 
 logger = logging.getLogger(__name__)
 
+# Area categories reported by _AreaClassifier, as bit flags
+_HOTSPOT = 1
+_IT_CORRIDOR = 2
+
+# Rule names in the order they are reported, and the shared tuple of names
+# for every combination, indexed by a bitmask with bit i set for rule i
+_RULE_NAMES = (
+    "Peak window triggered",
+    "IT corridor triggered",
+    "Hotspot triggered",
+    "Weekend adjustment",
+)
+_RULE_TUPLES = tuple(
+    tuple(name for index, name in enumerate(_RULE_NAMES) if mask >> index & 1)
+    for mask in range(1 << len(_RULE_NAMES))
+)
+_PEAK_WINDOW_RULE = 1 << 0
+_IT_CORRIDOR_RULE = 1 << 1
+_HOTSPOT_RULE = 1 << 2
+_WEEKEND_RULE = 1 << 3
+
+# Peak window flags for a time of day
+_MORNING_PEAK = 1
+_EVENING_PEAK = 2
+_HEAVIEST_BAND = 4
+
+# Scoring facts packed into a small int: peak flags in bits 0-2, area
+# categories in bits 3-4, weekend in bit 5
+_FACT_TABLE_SIZE = 1 << 6
+
+# Congestion level for each capped score
+_LEVELS_BY_SCORE = (CongestionLevel.LOW, CongestionLevel.MEDIUM, CongestionLevel.HIGH)
+
+# Times of day are compared as integer microseconds since midnight
+_MICROSECONDS_PER_MINUTE = 60 * 1_000_000
+_HEAVIEST_BAND_START = 18 * 60 * _MICROSECONDS_PER_MINUTE
+_HEAVIEST_BAND_END = 19 * 60 * _MICROSECONDS_PER_MINUTE
+
+# Half-minute slots per day: the start of each minute, then the rest of it
+_DAY_SLOTS = 24 * 60 * 2
+
+
+class _AreaClassifier:
+    """
+    Lowercased area names tagged with categories
+    
+    classify() reports the categories of every name contained in, or
+    containing, a location with one regex scan and one string scan, instead
+    of a substring test per name.
+    """
+    
+    __slots__ = (
+        '_pattern', '_contained_categories', '_names', '_categories', '_joined', '_starts',
+        '_shortest', '_longest', '_exact_categories',
+    )
+    
+    # Joins names for the reverse check; never part of a name or a location
+    _SEPARATOR = '\x00'
+    
+    def __init__(self, names_by_category: Dict[int, Iterable[str]]):
+        categories = {}
+        for category, names in names_by_category.items():
+            for name in names:
+                categories[name] = categories.get(name, 0) | category
+        
+        self._names = list(categories)
+        self._categories = [categories[name] for name in self._names]
+        
+        # A match reports the longest name starting at each position, which
+        # stands for every name inside it too
+        self._contained_categories = {}
+        for name in self._names:
+            found = 0
+            for other, category in categories.items():
+                if other in name:
+                    found |= category
+            self._contained_categories[name] = found
+        
+        # The lookahead lets matches overlap, so every start position is tried
+        ordered = sorted(self._names, key=len, reverse=True)
+        self._pattern = (
+            re.compile('(?=(' + '|'.join(re.escape(name) for name in ordered) + '))')
+            if ordered else None
+        )
+        
+        self._joined = self._SEPARATOR.join(self._names)
+        self._starts = []
+        offset = 0
+        for name in self._names:
+            self._starts.append(offset)
+            offset += len(name) + 1
+        
+        # A location shorter than every name contains none of them, and one
+        # longer than every name is contained in none of them
+        self._shortest = min(map(len, self._names), default=0)
+        self._longest = max(map(len, self._names), default=0)
+        
+        # Locations are usually exact area names, so their answers are
+        # precomputed and found with a single hash probe
+        self._exact_categories = {}
+        self._exact_categories = {name: self.classify(name) for name in self._names}
+    
+    def classify(self, location_lc: str) -> int:
+        """Get the categories of names contained in, or containing, a lowercased location"""
+        found = self._exact_categories.get(location_lc)
+        if found is not None:
+            return found
+        
+        found = 0
+        if not location_lc:
+            return found
+        
+        if self._pattern is not None and len(location_lc) >= self._shortest:
+            for match in self._pattern.finditer(location_lc):
+                found |= self._contained_categories[match.group(1)]
+        
+        # Names containing the location; each find resumes at the next name
+        if len(location_lc) <= self._longest and self._SEPARATOR not in location_lc:
+            index = self._joined.find(location_lc)
+            while index >= 0:
+                position = bisect.bisect_right(self._starts, index) - 1
+                found |= self._categories[position]
+                if position + 1 == len(self._starts):
+                    break
+                index = self._joined.find(location_lc, self._starts[position + 1])
+        
+        return found
+
+
+@dataclass(frozen=True, slots=True)
+class _ScoringFacts:
+    """Route and time facts shared by all scoring rules"""
+    is_weekend: bool
+    peak_flags: int
+    area_categories: int
+    has_peak_windows: bool
+    
+    @property
+    def index(self) -> int:
+        """Position of these facts in a score table"""
+        return self.peak_flags | self.area_categories << 3 | self.is_weekend << 5
+
 
 class ScoringEngine:
     """Engine for computing congestion scores using configuration rules"""
@@ -22,10 +168,50 @@ class ScoringEngine:
         self.config = config
         self.reasoning_engine = None
         
+        # Only a handful of (score, rules) pairs exist; cache their explanations per
+        # engine so the cache is discarded together with the config
+        self._explain_cached = functools.lru_cache(maxsize=64)(self._explain)
+        
+        # Area names are matched case-insensitively on every call, so lowercase them once
+        zones = (config.zones if config else None) or {}
+        hotspots = (config.hotspots if config else None) or []
+        self._it_corridor_lc = tuple(area.lower() for area in zones.get('zone_it_corridor') or [] if area)
+        self._hotspots_lc = tuple(hotspot.lower() for hotspot in hotspots if hotspot)
+        
+        # Each location is classified against both name lists in one pass, and
+        # the same few locations come up again and again
+        self._area_classifier = _AreaClassifier({
+            _HOTSPOT: self._hotspots_lc,
+            _IT_CORRIDOR: self._it_corridor_lc,
+        })
+        self._classify_cached = functools.lru_cache(maxsize=4096)(self._area_classifier.classify)
+        
+        # Windows with missing or non-time bounds never match, so they are
+        # dropped once here instead of being checked on every comparison
+        peak_windows = config.peak_windows if config else None
+        self._has_peak_windows = bool(peak_windows)
+        self._morning_range = self._usable_time_range(peak_windows.weekday_morning if peak_windows else None)
+        self._evening_range = self._usable_time_range(peak_windows.weekday_evening if peak_windows else None)
+        
+        # Peak windows are fixed per config, so their flags are looked up by minute
+        self._peak_minutes = self._build_peak_minutes()
+        
+        # There are only a few dozen distinct fact combinations per config, so
+        # every rule outcome is evaluated up front and scoring is a lookup
+        self._score_table = self._build_score_table()
+        
+        # With minute-level peak flags, the whole rule evaluation collapses to one
+        # byte per (weekday/weekend, time slot, area categories)
+        self._route_scores = self._build_route_scores()
+        
+        # Off-peak weekday slots score the same for every route, so those skip
+        # classifying the route entirely
+        self._area_dependent_slots = self._build_area_dependent_slots()
+        
         try:
             self.reasoning_engine = ReasoningEngine(config)
         except Exception as e:
-            logger.error(f"Failed to initialize reasoning engine: {e}")
+            logger.error("Failed to initialize reasoning engine: %s", e)
             # Continue without reasoning engine, will use fallbacks
     
     def calculate_congestion(self, origin: str, destination: str, 
@@ -46,274 +232,323 @@ class ScoringEngine:
             if not origin or not destination or not departure_time:
                 return self._create_error_result("Invalid input parameters for congestion calculation")
             
-            # Start with base score (Low = 0, Medium = 1, High = 2)
-            score = 0
-            triggered_rules = []
-            
-            # Apply peak window penalty with error handling
-            try:
-                peak_penalty = self._apply_peak_window_penalty(departure_time)
-                if peak_penalty > 0:
-                    score += peak_penalty
-                    triggered_rules.append("Peak window triggered")
-            except Exception as e:
-                logger.error(f"Error applying peak window penalty: {e}")
-                # Continue without peak penalty
-            
-            # Apply IT corridor multiplier with error handling
-            try:
-                corridor_penalty = self._apply_corridor_multiplier(
-                    [origin, destination], departure_time
-                )
-                if corridor_penalty > 0:
-                    score += corridor_penalty
-                    triggered_rules.append("IT corridor triggered")
-            except Exception as e:
-                logger.error(f"Error applying corridor multiplier: {e}")
-                # Continue without corridor penalty
-            
-            # Apply hotspot penalty with error handling
-            try:
-                hotspot_penalty = self._apply_hotspot_penalty(
-                    [origin, destination], departure_time
-                )
-                if hotspot_penalty > 0:
-                    score += hotspot_penalty
-                    triggered_rules.append("Hotspot triggered")
-            except Exception as e:
-                logger.error(f"Error applying hotspot penalty: {e}")
-                # Continue without hotspot penalty
-            
-            # Apply weekend adjustment with error handling
-            try:
-                weekend_adjustment = self._apply_weekend_adjustment(
-                    departure_time, [origin, destination]
-                )
-                if weekend_adjustment != 0:
-                    score += weekend_adjustment
-                    if weekend_adjustment < 0:
-                        triggered_rules.append("Weekend adjustment")
-            except Exception as e:
-                logger.error(f"Error applying weekend adjustment: {e}")
-                # Continue without weekend adjustment
-            
-            # Cap score at High level (2) and floor at Low level (0)
-            score = min(max(score, 0), 2)
+            score, triggered_rules = self._compute_score_rules(
+                origin.lower(), destination.lower(), departure_time
+            )
             
-            # Convert score to congestion level
-            if score == 0:
-                level = CongestionLevel.LOW
-            elif score == 1:
-                level = CongestionLevel.MEDIUM
-            else:
-                level = CongestionLevel.HIGH
+            # Reasoning only depends on the score and triggered rules, so it is shared
+            # too; every caller still gets its own result and rules list to modify
+            reasoning, departure_recommendation = self._explain_cached(score, triggered_rules)
             
-            # Create initial result
-            result = CongestionResult(
-                level=level,
+            return CongestionResult(
+                level=_LEVELS_BY_SCORE[score],
                 score=score,
-                triggered_rules=triggered_rules,
-                departure_recommendation="",  # Will be set by reasoning engine
-                reasoning=""  # Will be set by reasoning engine
+                triggered_rules=list(triggered_rules),
+                departure_recommendation=departure_recommendation,
+                reasoning=reasoning
             )
             
-            # Generate reasoning and departure recommendation using reasoning engine
-            try:
-                if self.reasoning_engine:
-                    reasoning = self.reasoning_engine.generate_explanation(result)
-                    departure_recommendation = self.reasoning_engine.get_departure_recommendation(result)
-                else:
-                    reasoning = self._generate_fallback_reasoning(result)
-                    departure_recommendation = self._generate_fallback_departure_recommendation(result)
-                
-                # Update result with reasoning engine outputs
-                result.reasoning = reasoning
-                result.departure_recommendation = departure_recommendation
-                
-            except Exception as e:
-                logger.error(f"Error generating reasoning: {e}")
-                result.reasoning = self._generate_fallback_reasoning(result)
-                result.departure_recommendation = self._generate_fallback_departure_recommendation(result)
-            
-            return result
-            
         except Exception as e:
-            logger.error(f"Unexpected error in congestion calculation: {e}")
+            logger.error("Unexpected error in congestion calculation: %s", e)
             return self._create_error_result(f"Unable to calculate congestion due to system error: {e}")
     
-    def _apply_peak_window_penalty(self, departure_time: datetime) -> int:
-        """Apply penalty for peak window times"""
+    def _explain(self, score: int, triggered_rules: Tuple[str, ...]) -> Tuple[str, str]:
+        """Generate (reasoning, departure recommendation) for a score and its triggered rules"""
+        result = CongestionResult(
+            level=_LEVELS_BY_SCORE[score],
+            score=score,
+            triggered_rules=list(triggered_rules),
+            departure_recommendation="",
+            reasoning=""
+        )
+        
+        # Generate reasoning and departure recommendation using reasoning engine
         try:
-            if not departure_time:
-                return 0
-            
-            current_time = departure_time.time()
-            is_weekday = departure_time.weekday() < 5  # Monday = 0, Sunday = 6
-            
-            if not is_weekday:
-                return 0
-            
-            penalty = 0
-            
-            # Check morning peak with safe access
-            if (self.config and self.config.peak_windows and 
-                self.config.peak_windows.weekday_morning and
-                self._time_in_range(current_time, self.config.peak_windows.weekday_morning)):
-                penalty += 1
-            
-            # Check evening peak with safe access
-            if (self.config and self.config.peak_windows and 
-                self.config.peak_windows.weekday_evening and
-                self._time_in_range(current_time, self.config.peak_windows.weekday_evening)):
-                penalty += 1
-                
-                # Extra penalty for heaviest band (18:00-19:00)
-                if time(18, 0) <= current_time <= time(19, 0):
-                    penalty += 1
-            
-            return penalty
+            if self.reasoning_engine:
+                reasoning = self.reasoning_engine.generate_explanation(result)
+                departure_recommendation = self.reasoning_engine.get_departure_recommendation(result)
+            else:
+                reasoning = self._generate_fallback_reasoning(result)
+                departure_recommendation = self._generate_fallback_departure_recommendation(result)
             
         except Exception as e:
-            logger.error(f"Error in peak window penalty calculation: {e}")
-            return 0  # Safe fallback
+            logger.error("Error generating reasoning: %s", e)
+            reasoning = self._generate_fallback_reasoning(result)
+            departure_recommendation = self._generate_fallback_departure_recommendation(result)
+        
+        return reasoning, departure_recommendation
     
-    def _apply_corridor_multiplier(self, locations: List[str], departure_time: datetime) -> int:
-        """Apply IT corridor multiplier during peak times"""
-        try:
-            if not locations or not departure_time:
-                return 0
-            
-            is_weekday = departure_time.weekday() < 5
-            if not is_weekday:
-                return 0
-            
-            # Check if any location is in IT corridor with safe access
-            if not (self.config and self.config.zones):
-                return 0
-            
-            it_corridor_areas = self.config.zones.get('zone_it_corridor', [])
-            if not it_corridor_areas:
-                return 0
-            
-            has_it_corridor = any(
-                any(area.lower() in location.lower() or location.lower() in area.lower() 
-                    for area in it_corridor_areas if area)
-                for location in locations if location
-            )
-            
-            if not has_it_corridor:
-                return 0
-            
-            # Check if time overlaps with peak windows
-            current_time = departure_time.time()
-            is_peak_time = False
-            
-            if (self.config.peak_windows and self.config.peak_windows.weekday_morning and
-                self._time_in_range(current_time, self.config.peak_windows.weekday_morning)):
-                is_peak_time = True
-            
-            if (self.config.peak_windows and self.config.peak_windows.weekday_evening and
-                self._time_in_range(current_time, self.config.peak_windows.weekday_evening)):
-                is_peak_time = True
-            
-            return 1 if is_peak_time else 0
+    def calculate_congestion_batch(self, origins: Sequence[str], destinations: Sequence[str],
+                                   departure_times: Sequence[datetime]) -> List[CongestionResult]:
+        """
+        Calculate congestion scores for many routes, e.g. a grid of departure times
+        
+        Args:
+            origins: Starting location name for each route
+            destinations: Ending location name for each route
+            departure_times: When each trip will start
             
-        except Exception as e:
-            logger.error(f"Error in corridor multiplier calculation: {e}")
-            return 0  # Safe fallback
+        Returns:
+            One CongestionResult per route, in input order
+        """
+        if not len(origins) == len(destinations) == len(departure_times):
+            raise ValueError("origins, destinations and departure_times must have the same length")
+        
+        return [
+            self.calculate_congestion(origin, destination, departure_time)
+            for origin, destination, departure_time in zip(origins, destinations, departure_times)
+        ]
     
-    def _apply_hotspot_penalty(self, locations: List[str], departure_time: datetime) -> int:
-        """Apply penalty for hotspot locations during peak times"""
-        try:
-            if not locations or not departure_time:
-                return 0
-            
-            current_time = departure_time.time()
-            is_weekday = departure_time.weekday() < 5
-            
-            # Check if any location is a hotspot with safe access
-            if not (self.config and self.config.hotspots):
-                return 0
-            
-            has_hotspot = any(
-                any(hotspot.lower() in location.lower() or location.lower() in hotspot.lower()
-                    for hotspot in self.config.hotspots if hotspot)
-                for location in locations if location
-            )
-            
-            if not has_hotspot:
-                return 0
-            
-            # Apply penalty during peak windows
-            is_peak_time = False
-            
-            if is_weekday and self.config.peak_windows:
-                if (self.config.peak_windows.weekday_morning and
-                    self._time_in_range(current_time, self.config.peak_windows.weekday_morning)):
-                    is_peak_time = True
-                
-                if (self.config.peak_windows.weekday_evening and
-                    self._time_in_range(current_time, self.config.peak_windows.weekday_evening)):
-                    is_peak_time = True
-            else:
-                # Weekend: hotspots can still be busy around major areas
-                is_peak_time = True
-            
-            return 1 if is_peak_time else 0
-            
-        except Exception as e:
-            logger.error(f"Error in hotspot penalty calculation: {e}")
-            return 0  # Safe fallback
+    def _compute_score_rules(self, origin_lc: str, destination_lc: str,
+                             departure_time: datetime) -> Tuple[int, Tuple[str, ...]]:
+        """Compute the capped score and triggered rules for normalized inputs"""
+        if self._route_scores is None:
+            facts = self._collect_facts([origin_lc, destination_lc], departure_time)
+            score, rules_mask = self._score_from_facts(facts)
+            return score, _RULE_TUPLES[rules_mask]
+        
+        slot = self._time_slot(departure_time.time())
+        if departure_time.weekday() >= 5:
+            slot += _DAY_SLOTS
+        if not self._area_dependent_slots[slot]:
+            packed = self._route_scores[slot << 2]
+        else:
+            # Both names were validated non-empty and lowercased by the caller
+            area_categories = self._classify_cached(origin_lc) | self._classify_cached(destination_lc)
+            packed = self._route_scores[slot << 2 | area_categories]
+        return packed >> 4, _RULE_TUPLES[packed & 15]
     
-    def _apply_weekend_adjustment(self, departure_time: datetime, locations: List[str]) -> int:
-        """Apply weekend traffic adjustment"""
-        try:
-            if not departure_time or not locations:
-                return 0
-            
-            is_weekend = departure_time.weekday() >= 5  # Saturday = 5, Sunday = 6
-            
-            if not is_weekend:
-                return 0
-            
-            # Check if near hotspots with safe access
-            if not (self.config and self.config.hotspots):
-                return -1  # Default weekend reduction if no hotspot data
-            
-            has_hotspot = any(
-                any(hotspot.lower() in location.lower() or location.lower() in hotspot.lower()
-                    for hotspot in self.config.hotspots if hotspot)
-                for location in locations if location
+    def _collect_facts(self, locations: List[str], departure_time: datetime) -> _ScoringFacts:
+        """Derive everything the scoring rules look at, once per calculation"""
+        return _ScoringFacts(
+            is_weekend=departure_time.weekday() >= 5,  # Saturday = 5, Sunday = 6
+            peak_flags=self._peak_flags(departure_time.time()),
+            area_categories=self._classify_locations(locations),
+            has_peak_windows=self._has_peak_windows,
+        )
+    
+    def _score_from_facts(self, facts: _ScoringFacts) -> Tuple[int, int]:
+        """Look up (capped score, rules mask) for precomputed facts"""
+        return self._score_table[facts.index]
+    
+    def _build_score_table(self) -> Tuple[Tuple[int, int], ...]:
+        """Evaluate the scoring rules for every fact combination under this config"""
+        return tuple(
+            self._evaluate_rules(_ScoringFacts(
+                is_weekend=bool(index >> 5 & 1),
+                peak_flags=index & 7,
+                area_categories=index >> 3 & 3,
+                has_peak_windows=self._has_peak_windows,
+            ))
+            for index in range(_FACT_TABLE_SIZE)
+        )
+    
+    @classmethod
+    def _evaluate_rules(cls, facts: _ScoringFacts) -> Tuple[int, int]:
+        """Apply all scoring rules to precomputed facts, returning (capped score, rules mask)"""
+        # Start with base score (Low = 0, Medium = 1, High = 2)
+        score = 0
+        rules_mask = 0
+        
+        peak_penalty = cls._peak_window_penalty(facts)
+        if peak_penalty > 0:
+            score += peak_penalty
+            rules_mask |= _PEAK_WINDOW_RULE
+        
+        corridor_penalty = cls._corridor_penalty(facts)
+        if corridor_penalty > 0:
+            score += corridor_penalty
+            rules_mask |= _IT_CORRIDOR_RULE
+        
+        hotspot_penalty = cls._hotspot_penalty(facts)
+        if hotspot_penalty > 0:
+            score += hotspot_penalty
+            rules_mask |= _HOTSPOT_RULE
+        
+        weekend_adjustment = cls._weekend_adjustment(facts)
+        if weekend_adjustment < 0:
+            score += weekend_adjustment
+            rules_mask |= _WEEKEND_RULE
+        
+        # Cap score at High level (2) and floor at Low level (0)
+        return min(max(score, 0), 2), rules_mask
+    
+    @staticmethod
+    def _peak_window_penalty(facts: _ScoringFacts) -> int:
+        """Penalty for weekday peak windows, with an extra level in the heaviest band"""
+        if facts.is_weekend:
+            return 0
+        
+        penalty = 0
+        if facts.peak_flags & _MORNING_PEAK:
+            penalty += 1
+        if facts.peak_flags & _EVENING_PEAK:
+            penalty += 1
+            
+            # Extra penalty for heaviest band (18:00-19:00)
+            if facts.peak_flags & _HEAVIEST_BAND:
+                penalty += 1
+        
+        return penalty
+    
+    @staticmethod
+    def _corridor_penalty(facts: _ScoringFacts) -> int:
+        """Penalty for an IT corridor endpoint during a weekday peak window"""
+        if facts.is_weekend or not facts.area_categories & _IT_CORRIDOR:
+            return 0
+        return 1 if facts.peak_flags & (_MORNING_PEAK | _EVENING_PEAK) else 0
+    
+    @staticmethod
+    def _hotspot_penalty(facts: _ScoringFacts) -> int:
+        """Penalty for a hotspot endpoint during peak windows, or at any time on weekends"""
+        if not facts.area_categories & _HOTSPOT:
+            return 0
+        
+        if not facts.is_weekend and facts.has_peak_windows:
+            return 1 if facts.peak_flags & (_MORNING_PEAK | _EVENING_PEAK) else 0
+        
+        # Weekend: hotspots can still be busy around major areas
+        return 1
+    
+    @staticmethod
+    def _weekend_adjustment(facts: _ScoringFacts) -> int:
+        """Weekend reduction, unless an endpoint is near a hotspot"""
+        if not facts.is_weekend:
+            return 0
+        
+        # Without hotspot data no endpoint counts as near one
+        return 0 if facts.area_categories & _HOTSPOT else -1
+    
+    def _classify_locations(self, locations: List[str]) -> int:
+        """Get the area categories (_HOTSPOT, _IT_CORRIDOR) matched by any of the locations"""
+        found = 0
+        for location in locations:
+            if location:
+                found |= self._classify_cached(location.lower())
+        return found
+    
+    def _peak_flags(self, current_time: time) -> int:
+        """Get the peak window flags (_MORNING_PEAK, _EVENING_PEAK, _HEAVIEST_BAND) for a time of day"""
+        if self._peak_minutes is None:
+            return self._compute_peak_flags(current_time)
+        
+        return self._peak_minutes[self._time_slot(current_time)]
+    
+    @staticmethod
+    def _time_slot(current_time: time) -> int:
+        """Index of the half-minute slot holding a time of day"""
+        past_minute_start = 1 if current_time.second or current_time.microsecond else 0
+        return (current_time.hour * 60 + current_time.minute) * 2 + past_minute_start
+    
+    def _compute_peak_flags(self, current_time: time) -> int:
+        """Compare a time of day against the configured peak windows"""
+        return self._peak_flags_at(self._time_of_day(current_time))
+    
+    def _peak_flags_at(self, time_of_day: int) -> int:
+        """Compare microseconds since midnight against the configured peak windows"""
+        flags = 0
+        
+        if self._morning_range and self._time_in_range(time_of_day, self._morning_range):
+            flags |= _MORNING_PEAK
+        
+        if self._evening_range and self._time_in_range(time_of_day, self._evening_range):
+            flags |= _EVENING_PEAK
+        
+        if _HEAVIEST_BAND_START <= time_of_day <= _HEAVIEST_BAND_END:
+            flags |= _HEAVIEST_BAND
+        
+        return flags
+    
+    def _build_peak_minutes(self) -> Optional[bytes]:
+        """
+        Precompute peak flags for every minute of the day
+        
+        Entry minute * 2 holds the flags at the start of a minute and entry
+        minute * 2 + 1 those for the rest of it. Against windows bounded on
+        whole minutes, every time within that rest compares the same way.
+        Returns None when a window bound has seconds, so flags are computed per call.
+        """
+        for time_range in (self._morning_range, self._evening_range):
+            if not time_range:
+                continue
+            start, end, _ = time_range
+            if start % _MICROSECONDS_PER_MINUTE or end % _MICROSECONDS_PER_MINUTE:
+                return None
+        
+        peak_minutes = bytearray(24 * 60 * 2)
+        for minute_of_day in range(24 * 60):
+            minute_start = minute_of_day * _MICROSECONDS_PER_MINUTE
+            peak_minutes[minute_of_day * 2] = self._peak_flags_at(minute_start)
+            peak_minutes[minute_of_day * 2 + 1] = self._peak_flags_at(minute_start + 1)
+        
+        return bytes(peak_minutes)
+    
+    @staticmethod
+    def _usable_time_range(time_range) -> Optional[Tuple[int, int, bool]]:
+        """
+        Reduce a time range to (start, end, crosses midnight) in microseconds since midnight
+        
+        Returns None unless both bounds of the range are times.
+        """
+        if not (time_range and isinstance(getattr(time_range, 'start', None), time)
+                and isinstance(getattr(time_range, 'end', None), time)):
+            return None
+        start = ScoringEngine._time_of_day(time_range.start)
+        end = ScoringEngine._time_of_day(time_range.end)
+        return start, end, start > end
+    
+    @staticmethod
+    def _time_of_day(current_time: time) -> int:
+        """Microseconds since midnight for a time of day"""
+        return (((current_time.hour * 60 + current_time.minute) * 60 + current_time.second) * 1_000_000
+                + current_time.microsecond)
+    
+    def _build_route_scores(self) -> Optional[bytes]:
+        """
+        Precompute score << 4 | rules mask for every weekday/weekend time slot and area categories
+        
+        Entries are indexed by (weekend * _DAY_SLOTS + time slot) << 2 | area categories.
+        Returns None when peak flags are not available per minute.
+        """
+        if self._peak_minutes is None:
+            return None
+        
+        route_scores = bytearray(2 * _DAY_SLOTS * 4)
+        for is_weekend in (0, 1):
+            day_start = is_weekend * _DAY_SLOTS * 4
+            for area_categories in range(4):
+                # Map each slot's peak flags straight to its packed outcome
+                packed_by_flags = bytearray(256)
+                for peak_flags in range(8):
+                    score, rules_mask = self._score_table[peak_flags | area_categories << 3 | is_weekend << 5]
+                    packed_by_flags[peak_flags] = score << 4 | rules_mask
+                start = day_start + area_categories
+                route_scores[start:start + _DAY_SLOTS * 4:4] = self._peak_minutes.translate(packed_by_flags)
+        
+        return bytes(route_scores)
+    
+    def _build_area_dependent_slots(self) -> Optional[bytes]:
+        """Flag each (weekday/weekend, time slot) whose outcome depends on the area categories"""
+        if self._route_scores is None:
+            return None
+        
+        route_scores = self._route_scores
+        return bytes(
+            not none == hotspot == corridor == both
+            for none, hotspot, corridor, both in zip(
+                route_scores[0::4], route_scores[1::4], route_scores[2::4], route_scores[3::4]
             )
-            
-            # Reduce congestion unless near hotspots
-            return 0 if has_hotspot else -1
-            
-        except Exception as e:
-            logger.error(f"Error in weekend adjustment calculation: {e}")
-            return 0  # Safe fallback
+        )
     
-    def _time_in_range(self, current_time: time, time_range) -> bool:
-        """Check if current time falls within a time range"""
-        try:
-            if not time_range or not current_time:
-                return False
-            
-            start_time = time_range.start
-            end_time = time_range.end
-            
-            if not start_time or not end_time:
-                return False
-            
-            # Handle ranges that cross midnight
-            if start_time <= end_time:
-                return start_time <= current_time <= end_time
-            else:
-                return current_time >= start_time or current_time <= end_time
-                
-        except Exception as e:
-            logger.error(f"Error checking time in range: {e}")
-            return False
+    @staticmethod
+    def _time_in_range(time_of_day: int, time_range: Tuple[int, int, bool]) -> bool:
+        """Check if a time of day falls within a (start, end, crosses midnight) range"""
+        start, end, crosses_midnight = time_range
+        
+        # Handle ranges that cross midnight
+        if crosses_midnight:
+            return time_of_day >= start or time_of_day <= end
+        return start <= time_of_day <= end
     
     def _create_error_result(self, error_message: str) -> CongestionResult:
         """Create a congestion result for error cases"""
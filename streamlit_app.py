@@ -3,17 +3,22 @@ Streamlit web application for Hyderabad Traffic Guide
 """
 import streamlit as st
 from datetime import datetime, time
-from typing import Optional, Dict, Tuple
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple
+import bisect
+import functools
 import logging
-import folium
-from streamlit_folium import st_folium
-from geopy.geocoders import Nominatim
-from geopy.distance import geodesic
+import math
 import time as time_module
 
 from app.traffic_controller import TrafficController
+from parsers.config_parser import DEFAULT_CONFIG_PATH
 from models.data_models import CongestionLevel
 
+# Map and geocoding libraries take most of a second to import, so they are
+# imported where they are used and only sessions that need them pay for it
+if TYPE_CHECKING:
+    import folium
+
 
 # Set up logging
 logging.basicConfig(level=logging.WARNING)
@@ -152,10 +157,46 @@ HYDERABAD_LOCATIONS = {
     "Aramghar": (17.3167, 78.4333),
 }
 
-# Initialize geocoder
+# Traffic hotspots marked on the interactive map, in drawing order
+HOTSPOT_MARKERS = (
+    "Gachibowli", "Financial District", "Hitec City", "Madhapur",
+    "Punjagutta", "Ameerpet", "Charminar", "Dilsukhnagar",
+    "Secunderabad", "Bison Signal"
+)
+
+# Hotspots flagged when a route passes through them
+ROUTE_HOTSPOTS = frozenset(HOTSPOT_MARKERS + ("Paradise Circle",))
+
+# Known locations as parallel tuples in HYDERABAD_LOCATIONS order
+_LOCATION_NAMES = tuple(HYDERABAD_LOCATIONS)
+_LOCATIONS_BY_KEY = {name.casefold(): coords for name, coords in HYDERABAD_LOCATIONS.items()}
+_LOCATION_LATS = tuple(coords[0] for coords in HYDERABAD_LOCATIONS.values())
+_LOCATION_LONS = tuple(coords[1] for coords in HYDERABAD_LOCATIONS.values())
+
+# Positions of those locations ordered by latitude, so the ones inside a
+# route's bounding box come from a single slice
+_POSITIONS_BY_LATITUDE = tuple(sorted(range(len(_LOCATION_NAMES)), key=_LOCATION_LATS.__getitem__))
+_SORTED_LATITUDES = tuple(_LOCATION_LATS[position] for position in _POSITIONS_BY_LATITUDE)
+_SORTED_LONGITUDES = tuple(_LOCATION_LONS[position] for position in _POSITIONS_BY_LATITUDE)
+
+# Initialize geocoder; the requests adapter keeps one pooled keep-alive
+# session, so lookups after the first skip the TCP and TLS handshakes
 @st.cache_resource
 def get_geocoder():
-    return Nominatim(user_agent="hyderabad_traffic_guide")
+    from geopy.adapters import RequestsAdapter
+    from geopy.geocoders import Nominatim
+    
+    return Nominatim(user_agent="hyderabad_traffic_guide", adapter_factory=RequestsAdapter)
+
+
+# Lookups that fail with an error are not cached and are retried on the next rerun
+@st.cache_data(ttl=86400, show_spinner=False)
+def geocode_location(location_name: str) -> Optional[Tuple[float, float]]:
+    """Geocode a location within Hyderabad, returning None if it is not found"""
+    location = get_geocoder().geocode(f"{location_name}, Hyderabad, Telangana, India")
+    if location:
+        return (location.latitude, location.longitude)
+    return None
 
 
 def create_abstract_route_map(origin: str, destination: str, analysis=None):
@@ -166,33 +207,7 @@ def create_abstract_route_map(origin: str, destination: str, analysis=None):
         dest_coords = get_location_coordinates(destination)
         
         # Find intermediate locations along the route
-        intermediate_locations = []
-        
-        # Simple logic to find locations roughly between origin and destination
-        min_lat = min(origin_coords[0], dest_coords[0])
-        max_lat = max(origin_coords[0], dest_coords[0])
-        min_lon = min(origin_coords[1], dest_coords[1])
-        max_lon = max(origin_coords[1], dest_coords[1])
-        
-        # Find locations within the bounding box
-        for location, coords in HYDERABAD_LOCATIONS.items():
-            if (location != origin and location != destination and
-                min_lat <= coords[0] <= max_lat and
-                min_lon <= coords[1] <= max_lon):
-                # Calculate distance from the direct route line
-                try:
-                    distance_to_route = abs((dest_coords[1] - origin_coords[1]) * (origin_coords[0] - coords[0]) - 
-                                          (origin_coords[1] - coords[1]) * (dest_coords[0] - origin_coords[0])) / \
-                                       ((dest_coords[1] - origin_coords[1])**2 + (dest_coords[0] - origin_coords[0])**2)**0.5
-                    
-                    # Only include locations close to the route
-                    if distance_to_route < 0.05:  # Roughly 5km threshold
-                        intermediate_locations.append(location)
-                except:
-                    continue
-        
-        # Limit to 3-4 intermediate locations
-        intermediate_locations = intermediate_locations[:4]
+        intermediate_locations = find_intermediate_locations(origin, destination, origin_coords, dest_coords)
         
         # Display route using Streamlit components
         st.markdown("### 🗺️ Route Overview")
@@ -207,13 +222,7 @@ def create_abstract_route_map(origin: str, destination: str, analysis=None):
                 st.markdown("**Route passes through:**")
                 for location in intermediate_locations:
                     # Check if it's a hotspot
-                    is_hotspot = location in [
-                        "Gachibowli", "Financial District", "Hitec City", "Madhapur",
-                        "Punjagutta", "Ameerpet", "Charminar", "Dilsukhnagar",
-                        "Secunderabad", "Bison Signal", "Paradise Circle"
-                    ]
-                    
-                    if is_hotspot:
+                    if location in ROUTE_HOTSPOTS:
                         st.warning(f"🔴 {location} (Traffic Hotspot)")
                     else:
                         st.info(f"📍 {location}")
@@ -231,38 +240,107 @@ def create_abstract_route_map(origin: str, destination: str, analysis=None):
                 st.info(f"🎯 **End:** {destination}")
             
             # Distance info
-            distance = geodesic(origin_coords, dest_coords).kilometers
+            distance = haversine_km(origin_coords, dest_coords)
             st.markdown(f"**📏 Distance:** ~{distance:.1f} km")
         
         return True
         
     except Exception as e:
-        logger.error(f"Error creating abstract route map: {e}")
+        logger.error("Error creating abstract route map: %s", e)
         st.error("Unable to generate route visualization")
         return False
 
 
+def find_intermediate_locations(origin: str, destination: str,
+                                origin_coords: Tuple[float, float],
+                                dest_coords: Tuple[float, float]) -> List[str]:
+    """Find up to 4 known locations near the direct line between origin and destination"""
+    intermediate_locations = []
+    
+    # Simple logic to find locations roughly between origin and destination
+    min_lat = min(origin_coords[0], dest_coords[0])
+    max_lat = max(origin_coords[0], dest_coords[0])
+    min_lon = min(origin_coords[1], dest_coords[1])
+    max_lon = max(origin_coords[1], dest_coords[1])
+    
+    # Find locations within the bounding box, in database order
+    start = bisect.bisect_left(_SORTED_LATITUDES, min_lat)
+    end = bisect.bisect_right(_SORTED_LATITUDES, max_lat)
+    candidates = sorted(
+        position
+        for position, lon in zip(_POSITIONS_BY_LATITUDE[start:end], _SORTED_LONGITUDES[start:end])
+        if min_lon <= lon <= max_lon
+    )
+    
+    # The route line is the same for every candidate; a zero-length route has none
+    origin_lat, origin_lon = origin_coords
+    delta_lat = dest_coords[0] - origin_lat
+    delta_lon = dest_coords[1] - origin_lon
+    route_length_sq = delta_lon**2 + delta_lat**2
+    if not route_length_sq:
+        return intermediate_locations
+    
+    # Compare squared distances to skip a square root and a division per candidate
+    threshold_sq = 0.05**2 * route_length_sq  # Roughly 5km threshold
+    
+    for position in candidates:
+        location = _LOCATION_NAMES[position]
+        if location != origin and location != destination:
+            lat = _LOCATION_LATS[position]
+            lon = _LOCATION_LONS[position]
+            
+            # Distance from the direct route line, scaled by the route length
+            offset = delta_lon * (origin_lat - lat) - (origin_lon - lon) * delta_lat
+            
+            # Only include locations close to the route
+            if offset * offset < threshold_sq:
+                intermediate_locations.append(location)
+                
+                # Limit to 3-4 intermediate locations
+                if len(intermediate_locations) == 4:
+                    break
+    
+    return intermediate_locations
+
+
+def haversine_km(origin_coords: Tuple[float, float], dest_coords: Tuple[float, float]) -> float:
+    """Great-circle distance in km; within about 0.5% of geodesic, plenty for a "~X km" hint"""
+    lat1, lon1 = map(math.radians, origin_coords)
+    lat2, lon2 = map(math.radians, dest_coords)
+    h = math.sin((lat2 - lat1) / 2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2)**2
+    return 2 * 6371.0088 * math.asin(math.sqrt(h))
+
+
 def get_location_coordinates(location_name: str) -> Tuple[float, float]:
     """Get coordinates for a location, with fallback to geocoding"""
-    # First check our predefined locations
-    if location_name in HYDERABAD_LOCATIONS:
-        return HYDERABAD_LOCATIONS[location_name]
-    
-    # Fallback to geocoding for unknown locations
     try:
-        geocoder = get_geocoder()
-        location = geocoder.geocode(f"{location_name}, Hyderabad, Telangana, India")
-        if location:
-            return (location.latitude, location.longitude)
+        return _resolve_location(location_name.strip().casefold())
     except Exception as e:
-        logger.warning(f"Geocoding failed for {location_name}: {e}")
+        logger.warning("Geocoding failed for %s: %s", location_name, e)
     
     # Default to Hyderabad center if all else fails
     return (17.3850, 78.4867)
 
 
-def create_traffic_map(origin: str, destination: str, analysis=None) -> folium.Map:
+# Keyed on the normalized name; geocoding errors propagate and are not cached
+@functools.lru_cache(maxsize=1024)
+def _resolve_location(name_key: str) -> Tuple[float, float]:
+    # First check our predefined locations
+    if name_key in _LOCATIONS_BY_KEY:
+        return _LOCATIONS_BY_KEY[name_key]
+    
+    # Fallback to geocoding for unknown locations
+    coords = geocode_location(name_key)
+    if coords:
+        return coords
+    
+    return (17.3850, 78.4867)
+
+
+def create_traffic_map(origin: str, destination: str, analysis=None) -> "folium.Map":
     """Create an interactive map showing the route and traffic conditions"""
+    import folium
+    
     try:
         # Get coordinates
         origin_coords = get_location_coordinates(origin)
@@ -314,13 +392,7 @@ def create_traffic_map(origin: str, destination: str, analysis=None) -> folium.M
         ).add_to(m)
         
         # Add traffic hotspots as markers
-        hotspot_locations = [
-            "Gachibowli", "Financial District", "Hitec City", "Madhapur",
-            "Punjagutta", "Ameerpet", "Charminar", "Dilsukhnagar",
-            "Secunderabad", "Bison Signal"
-        ]
-        
-        for hotspot in hotspot_locations:
+        for hotspot in HOTSPOT_MARKERS:
             if hotspot in HYDERABAD_LOCATIONS:
                 coords = HYDERABAD_LOCATIONS[hotspot]
                 folium.CircleMarker(
@@ -351,7 +423,7 @@ def create_traffic_map(origin: str, destination: str, analysis=None) -> folium.M
         return m
         
     except Exception as e:
-        logger.error(f"Error creating map: {e}")
+        logger.error("Error creating map: %s", e)
         # Return a basic Hyderabad map if there's an error
         m = folium.Map(location=[17.3850, 78.4867], zoom_start=10)
         return m
@@ -359,6 +431,8 @@ def create_traffic_map(origin: str, destination: str, analysis=None) -> folium.M
 
 def display_route_map(origin: str, destination: str, analysis=None):
     """Display the interactive route map in Streamlit"""
+    from streamlit_folium import st_folium
+    
     try:
         st.markdown("### 🗺️ Route Map")
         
@@ -387,22 +461,41 @@ def display_route_map(origin: str, destination: str, analysis=None):
         # Display distance information
         origin_coords = get_location_coordinates(origin)
         dest_coords = get_location_coordinates(destination)
-        distance = geodesic(origin_coords, dest_coords).kilometers
+        distance = haversine_km(origin_coords, dest_coords)
         
         st.info(f"📏 **Approximate Distance:** {distance:.1f} km")
         
     except Exception as e:
-        logger.error(f"Error displaying route map: {e}")
+        logger.error("Error displaying route map: %s", e)
         st.error("Unable to display map. Please check your internet connection.")
 
 
+def config_signature() -> Optional[Tuple[int, int]]:
+    """Get the config file's (mtime_ns, size), or None if it can't be read"""
+    try:
+        stat = DEFAULT_CONFIG_PATH.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# The controller only holds parsed configuration and engines, so one instance
+# is shared by every session and rerun; it is rebuilt when product.md changes
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_controller(signature: Optional[Tuple[int, int]]) -> TrafficController:
+    return TrafficController()
+
+
 def initialize_controller() -> Optional[TrafficController]:
     """Initialize traffic controller with error handling"""
     try:
-        controller = TrafficController()
+        controller = load_controller(config_signature())
         
         # Check if controller initialization failed
         if controller._initialization_error:
+            # Don't keep a broken controller; retry once the config is fixed
+            load_controller.clear()
+            
             st.error("⚠️ Configuration Error")
             st.error(controller._initialization_error)
             
@@ -445,7 +538,7 @@ def initialize_controller() -> Optional[TrafficController]:
         return None
         
     except Exception as e:
-        logger.error(f"Unexpected error initializing controller: {e}")
+        logger.error("Unexpected error initializing controller: %s", e)
         st.error("⚠️ System Initialization Error")
         st.error(f"An unexpected error occurred: {e}")
         st.info("**Troubleshooting:**")
@@ -455,18 +548,86 @@ def initialize_controller() -> Optional[TrafficController]:
         return None
 
 
+_CONGESTION_COLORS = {
+    CongestionLevel.LOW: "green",
+    CongestionLevel.MEDIUM: "orange", 
+    CongestionLevel.HIGH: "red"
+}
+
+
 def get_congestion_color(level: CongestionLevel) -> str:
     """Get color for congestion level display"""
-    try:
-        color_map = {
-            CongestionLevel.LOW: "green",
-            CongestionLevel.MEDIUM: "orange", 
-            CongestionLevel.HIGH: "red"
-        }
-        return color_map.get(level, "gray")
-    except Exception as e:
-        logger.error(f"Error getting congestion color: {e}")
-        return "gray"
+    return _CONGESTION_COLORS.get(level, "gray")
+
+
+_EMOJI_MAP = {"LOW": "🟢", "MEDIUM": "🟡", "HIGH": "🔴"}
+
+# Result cards for display_results; st.markdown dedents them before rendering
+_LEVEL_CARD_HTML = """
+<div style="
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    padding: 20px;
+    border-radius: 15px;
+    text-align: center;
+    color: white;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+">
+    <h2 style="margin: 0; font-size: 2.5em;">{emoji}</h2>
+    <h3 style="margin: 10px 0; color: white;">Traffic Level</h3>
+    <h2 style="margin: 0; color: white;">{level}</h2>
+</div>
+"""
+
+_RECOMMENDATION_CARD_HTML = """
+<div style="
+    background: {color};
+    padding: 15px;
+    border-radius: 10px;
+    margin-bottom: 15px;
+    color: white;
+">
+    <h4 style="margin: 0; color: white;">{icon} Recommendation</h4>
+    <p style="margin: 5px 0 0 0; font-size: 1.1em; color: white;">{text}</p>
+</div>
+"""
+
+_DEPARTURE_WINDOW_CARD_HTML = """
+<div style="
+    background: #17a2b8;
+    padding: 15px;
+    border-radius: 10px;
+    margin-bottom: 15px;
+    color: white;
+">
+    <h4 style="margin: 0; color: white;">🕐 Best Departure Window</h4>
+    <p style="margin: 5px 0 0 0; font-size: 1.1em; color: white;">{text}</p>
+</div>
+"""
+
+_REASONING_CARD_HTML = """
+<div style="
+    background: #6c757d;
+    padding: 15px;
+    border-radius: 10px;
+    color: white;
+">
+    <h4 style="margin: 0; color: white;">💡 Why This Rating?</h4>
+    <p style="margin: 5px 0 0 0; color: white;">{text}</p>
+</div>
+"""
+
+_HOTSPOT_WARNING_HTML = """
+<div style="
+    background: #dc3545;
+    padding: 10px 15px;
+    border-radius: 8px;
+    margin: 5px 0;
+    color: white;
+    border-left: 4px solid #721c24;
+">
+    🚨 {text}
+</div>
+"""
 
 
 def display_results(analysis, show_reasoning: bool = False):
@@ -480,97 +641,50 @@ def display_results(analysis, show_reasoning: bool = False):
             st.error("Invalid analysis results")
             return
         
+        congestion = analysis.congestion
+        level = congestion.level.value
+        recommendation = congestion.departure_recommendation
+        reasoning = congestion.reasoning
+        
         # Create a visually appealing results container
         st.markdown("---")
         
         # Main congestion result with enhanced styling
-        congestion_color = get_congestion_color(analysis.congestion.level)
-        level_emoji = {"LOW": "🟢", "MEDIUM": "🟡", "HIGH": "🔴"}
-        emoji = level_emoji.get(analysis.congestion.level.value, "⚪")
+        congestion_color = get_congestion_color(congestion.level)
+        emoji = _EMOJI_MAP.get(level, "⚪")
         
         # Create columns for better layout
         col1, col2 = st.columns([1, 2])
         
         with col1:
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                padding: 20px;
-                border-radius: 15px;
-                text-align: center;
-                color: white;
-                box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-            ">
-                <h2 style="margin: 0; font-size: 2.5em;">{emoji}</h2>
-                <h3 style="margin: 10px 0; color: white;">Traffic Level</h3>
-                <h2 style="margin: 0; color: white;">{analysis.congestion.level.value}</h2>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_LEVEL_CARD_HTML.format(emoji=emoji, level=level),
+                        unsafe_allow_html=True)
         
         with col2:
             # Departure recommendation with styling
-            if analysis.congestion.departure_recommendation:
-                rec_color = "#28a745" if "leave now" in analysis.congestion.departure_recommendation.lower() else "#ffc107"
-                rec_icon = "🚀" if "leave now" in analysis.congestion.departure_recommendation.lower() else "⏰"
+            if recommendation:
+                leave_now = "leave now" in recommendation.lower()
+                rec_color, rec_icon = ("#28a745", "🚀") if leave_now else ("#ffc107", "⏰")
                 
-                st.markdown(f"""
-                <div style="
-                    background: {rec_color};
-                    padding: 15px;
-                    border-radius: 10px;
-                    margin-bottom: 15px;
-                    color: white;
-                ">
-                    <h4 style="margin: 0; color: white;">{rec_icon} Recommendation</h4>
-                    <p style="margin: 5px 0 0 0; font-size: 1.1em; color: white;">{analysis.congestion.departure_recommendation}</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_RECOMMENDATION_CARD_HTML.format(
+                    color=rec_color, icon=rec_icon, text=recommendation
+                ), unsafe_allow_html=True)
             
             # Departure window
             if analysis.departure_window:
-                st.markdown(f"""
-                <div style="
-                    background: #17a2b8;
-                    padding: 15px;
-                    border-radius: 10px;
-                    margin-bottom: 15px;
-                    color: white;
-                ">
-                    <h4 style="margin: 0; color: white;">🕐 Best Departure Window</h4>
-                    <p style="margin: 5px 0 0 0; font-size: 1.1em; color: white;">{analysis.departure_window}</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_DEPARTURE_WINDOW_CARD_HTML.format(text=analysis.departure_window),
+                            unsafe_allow_html=True)
             
             # Brief explanation
-            if analysis.congestion.reasoning:
-                st.markdown(f"""
-                <div style="
-                    background: #6c757d;
-                    padding: 15px;
-                    border-radius: 10px;
-                    color: white;
-                ">
-                    <h4 style="margin: 0; color: white;">💡 Why This Rating?</h4>
-                    <p style="margin: 5px 0 0 0; color: white;">{analysis.congestion.reasoning}</p>
-                </div>
-                """, unsafe_allow_html=True)
+            if reasoning:
+                st.markdown(_REASONING_CARD_HTML.format(text=reasoning),
+                            unsafe_allow_html=True)
         
         # Hotspot warnings with enhanced styling
         if analysis.hotspot_warnings:
             st.markdown("### ⚠️ Traffic Hotspot Warnings")
             for warning in analysis.hotspot_warnings:
-                st.markdown(f"""
-                <div style="
-                    background: #dc3545;
-                    padding: 10px 15px;
-                    border-radius: 8px;
-                    margin: 5px 0;
-                    color: white;
-                    border-left: 4px solid #721c24;
-                ">
-                    🚨 {warning}
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_HOTSPOT_WARNING_HTML.format(text=warning), unsafe_allow_html=True)
         
         # Detailed reasoning (if requested)
         if show_reasoning and analysis.detailed_reasoning:
@@ -578,7 +692,7 @@ def display_results(analysis, show_reasoning: bool = False):
                 st.markdown(analysis.detailed_reasoning)
             
     except Exception as e:
-        logger.error(f"Error displaying results: {e}")
+        logger.error("Error displaying results: %s", e)
         st.error("⚠️ Error displaying results")
         st.error(f"Unable to display analysis results: {e}")
 
@@ -587,30 +701,33 @@ def validate_user_input(origin: str, destination: str, departure_time: datetime)
     """Validate user input with helpful error messages"""
     try:
         # Check origin
-        if not origin or not origin.strip():
+        origin_name = origin.strip() if origin else ""
+        if not origin_name:
             return False, "Please enter a valid origin location"
         
         # Check destination
-        if not destination or not destination.strip():
+        destination_name = destination.strip() if destination else ""
+        if not destination_name:
             return False, "Please enter a valid destination location"
         
         # Check if origin and destination are the same
-        if origin.strip().lower() == destination.strip().lower():
+        if origin_name.lower() == destination_name.lower():
             return False, "Origin and destination cannot be the same"
         
         # Check departure time
         if not departure_time:
             return False, "Please select a valid departure time"
         
-        # Check if departure time is too far in the past
+        # Check if departure time is too far in the past; only a time before
+        # now can be before midnight today
         now = datetime.now()
-        if departure_time < now.replace(hour=0, minute=0, second=0, microsecond=0):
+        if departure_time < now and departure_time < now.replace(hour=0, minute=0, second=0, microsecond=0):
             return False, "Departure time cannot be in the past"
         
         return True, ""
         
     except Exception as e:
-        logger.error(f"Error validating user input: {e}")
+        logger.error("Error validating user input: %s", e)
         return False, f"Input validation error: {e}"
 
 
@@ -626,6 +743,36 @@ def handle_analysis_error(error_message: str):
     st.info("4. Contact support if the problem persists")
 
 
+_ZONE_DISPLAY_NAMES = {
+    "zone_it_corridor": "🏢 IT Corridor",
+    "zone_central": "🏛️ Central Areas", 
+    "zone_dense_core": "🏘️ Dense Core",
+    "zone_transit_hub": "🚉 Transit Hubs",
+    "zone_event_sensitive": "⚠️ Event-Sensitive"
+}
+
+_AREA_CARD_HTML = """
+<div style="
+    background: {bg};
+    padding: 10px;
+    border-radius: 8px;
+    margin: 5px 0;
+    border-left: 4px solid {border};
+    text-align: center;
+">
+    <div style="font-size: 1.2em;">{indicator}</div>
+    <div style="font-weight: bold; margin: 5px 0;">{area}</div>
+    <div style="font-size: 0.8em; color: #666;">{text}</div>
+</div>
+"""
+
+# Card styling for (normal, hotspot) areas
+_AREA_CARD_STYLES = (
+    {"bg": "#e6ffe6", "border": "#28a745", "indicator": "🟢", "text": "Normal Traffic"},
+    {"bg": "#ffe6e6", "border": "#dc3545", "indicator": "🔴", "text": "Traffic Hotspot"},
+)
+
+
 def display_available_locations(controller: TrafficController):
     """Display all available locations organized by zones with enhanced styling"""
     if not controller.config or not controller.config.zones:
@@ -637,15 +784,9 @@ def display_available_locations(controller: TrafficController):
     
     # Create tabs for different zones
     zone_names = list(controller.config.zones.keys())
-    zone_display_names = {
-        "zone_it_corridor": "🏢 IT Corridor",
-        "zone_central": "🏛️ Central Areas", 
-        "zone_dense_core": "🏘️ Dense Core",
-        "zone_transit_hub": "🚉 Transit Hubs",
-        "zone_event_sensitive": "⚠️ Event-Sensitive"
-    }
+    hotspots_set = frozenset(controller.config.hotspots or ())
     
-    tabs = st.tabs([zone_display_names.get(zone, zone) for zone in zone_names])
+    tabs = st.tabs([_ZONE_DISPLAY_NAMES.get(zone, zone) for zone in zone_names])
     
     for i, zone in enumerate(zone_names):
         with tabs[i]:
@@ -655,23 +796,8 @@ def display_available_locations(controller: TrafficController):
             cols = st.columns(3)
             for idx, area in enumerate(areas):
                 with cols[idx % 3]:
-                    hotspot_indicator = "🔴" if area in controller.config.hotspots else "🟢"
-                    hotspot_text = "Traffic Hotspot" if area in controller.config.hotspots else "Normal Traffic"
-                    
-                    st.markdown(f"""
-                    <div style="
-                        background: {'#ffe6e6' if area in controller.config.hotspots else '#e6ffe6'};
-                        padding: 10px;
-                        border-radius: 8px;
-                        margin: 5px 0;
-                        border-left: 4px solid {'#dc3545' if area in controller.config.hotspots else '#28a745'};
-                        text-align: center;
-                    ">
-                        <div style="font-size: 1.2em;">{hotspot_indicator}</div>
-                        <div style="font-weight: bold; margin: 5px 0;">{area}</div>
-                        <div style="font-size: 0.8em; color: #666;">{hotspot_text}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    style = _AREA_CARD_STYLES[area in hotspots_set]
+                    st.markdown(_AREA_CARD_HTML.format(area=area, **style), unsafe_allow_html=True)
     
     st.markdown("---")
 
@@ -715,6 +841,86 @@ def handle_unknown_area(area_name: str):
             st.success(f"Area information submitted! Please add '{area_name}' to the product.md configuration file.")
 
 
+# Static page markup emitted at the top of every run of main()
+_PAGE_CSS = """
+<style>
+.main {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+}
+
+.header {
+    text-align: center;
+    padding: 2rem 0;
+    margin-bottom: 2rem;
+}
+
+.stButton > button {
+    background: #2563eb;
+    color: white;
+    border: none;
+    border-radius: 8px;
+    padding: 0.5rem 1.5rem;
+    font-weight: 500;
+}
+
+.traffic-result {
+    padding: 1rem;
+    border-radius: 8px;
+    margin: 1rem 0;
+    text-align: center;
+    font-weight: bold;
+    border: 2px solid;
+}
+
+.traffic-low { 
+    background: #dcfce7 !important; 
+    color: #166534 !important; 
+    border-color: #22c55e !important;
+}
+.traffic-medium { 
+    background: #fed7aa !important; 
+    color: #9a3412 !important; 
+    border-color: #f97316 !important;
+}
+.traffic-high { 
+    background: #fecaca !important; 
+    color: #991b1b !important; 
+    border-color: #ef4444 !important;
+}
+
+.disclaimer {
+    background: #f8fafc;
+    padding: 1rem;
+    border-radius: 8px;
+    margin-top: 2rem;
+    font-size: 0.9rem;
+    color: #64748b;
+}
+</style>
+"""
+
+_HEADER_HTML = """
+<div class="header">
+    <h1>🚗 Hyderabad Traffic Guide</h1>
+    <p>Quick traffic suggestions for your commute</p>
+</div>
+"""
+
+_DISCLAIMER_HTML = """
+<div class="disclaimer">
+    <strong>Note:</strong> This tool provides traffic suggestions based on general patterns. 
+    Actual conditions may vary. For official updates, check local traffic authorities.
+</div>
+"""
+
+_TRAFFIC_RESULT_HTML = """
+<div class="traffic-result {css_class}">
+    <h3>{emoji} {level} TRAFFIC</h3>
+    <p>{recommendation}</p>
+</div>
+"""
+
+
 def main():
     """Main Streamlit application with clean, minimal design"""
     st.set_page_config(
@@ -724,78 +930,13 @@ def main():
     )
     
     # Clean, minimal CSS
-    st.markdown("""
-    <style>
-    .main {
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    }
-    
-    .header {
-        text-align: center;
-        padding: 2rem 0;
-        margin-bottom: 2rem;
-    }
-    
-    .stButton > button {
-        background: #2563eb;
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 0.5rem 1.5rem;
-        font-weight: 500;
-    }
-    
-    .traffic-result {
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-        text-align: center;
-        font-weight: bold;
-        border: 2px solid;
-    }
-    
-    .traffic-low { 
-        background: #dcfce7 !important; 
-        color: #166534 !important; 
-        border-color: #22c55e !important;
-    }
-    .traffic-medium { 
-        background: #fed7aa !important; 
-        color: #9a3412 !important; 
-        border-color: #f97316 !important;
-    }
-    .traffic-high { 
-        background: #fecaca !important; 
-        color: #991b1b !important; 
-        border-color: #ef4444 !important;
-    }
-    
-    .disclaimer {
-        background: #f8fafc;
-        padding: 1rem;
-        border-radius: 8px;
-        margin-top: 2rem;
-        font-size: 0.9rem;
-        color: #64748b;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_PAGE_CSS, unsafe_allow_html=True)
     
     # Simple header
-    st.markdown("""
-    <div class="header">
-        <h1>🚗 Hyderabad Traffic Guide</h1>
-        <p>Quick traffic suggestions for your commute</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # Simple disclaimer at the top
-    st.markdown("""
-    <div class="disclaimer">
-        <strong>Note:</strong> This tool provides traffic suggestions based on general patterns. 
-        Actual conditions may vary. For official updates, check local traffic authorities.
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_DISCLAIMER_HTML, unsafe_allow_html=True)
     
     # Initialize controller
     controller = initialize_controller()
@@ -807,12 +948,10 @@ def main():
         st.markdown("### Peak Hours")
         st.info("**Morning:** 8-11 AM\n\n**Evening:** 5-8 PM")
     
-    # Get locations
+    # Get locations; the config sorts them once when it is parsed
     all_locations = []
     if controller.config and controller.config.zones:
-        for zone_areas in controller.config.zones.values():
-            all_locations.extend(zone_areas)
-    all_locations = sorted(set(all_locations))
+        all_locations = list(controller.config.all_areas_sorted)
     
     # Simple input form
     col1, col2 = st.columns(2)
@@ -896,12 +1035,10 @@ def main():
                             css_class = "traffic-high"
                             emoji = "🔴"
                         
-                        st.markdown(f"""
-                        <div class="traffic-result {css_class}">
-                            <h3>{emoji} {level} TRAFFIC</h3>
-                            <p>{analysis.congestion.departure_recommendation}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
+                        st.markdown(_TRAFFIC_RESULT_HTML.format(
+                            css_class=css_class, emoji=emoji, level=level,
+                            recommendation=analysis.congestion.departure_recommendation
+                        ), unsafe_allow_html=True)
                         
                         # Simple reasoning
                         if analysis.congestion.reasoning:
@@ -922,7 +1059,7 @@ if __name__ == "__main__":
     try:
         main()
     except Exception as e:
-        logger.error(f"Critical error in main application: {e}")
+        logger.error("Critical error in main application: %s", e)
         st.error("⚠️ Critical Application Error")
         st.error(f"The application encountered a critical error: {e}")
         st.info("Please refresh the page and try again. Contact support if the problem persists.")
\ No newline at end of file
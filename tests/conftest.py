@@ -0,0 +1,14 @@
+"""
+Shared pytest configuration
+"""
+import pytest
+
+from parsers.config_parser import CACHE_DIR_ENV_VAR
+
+
+@pytest.fixture(autouse=True, scope="session")
+def isolated_config_cache(tmp_path_factory):
+    """Keep parsed-config pickles out of the real home directory"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path_factory.mktemp("config-cache")))
+        yield
@@ -2,9 +2,8 @@
 Property-based tests for configuration parsing
 **Feature: hyderabad-traffic-guide, Property 8: Configuration parsing completeness**
 """
-import tempfile
-from pathlib import Path
 from hypothesis import given, strategies as st, settings
+from parsers import config_parser
 from parsers.config_parser import ConfigParser
 from models.data_models import TrafficConfig
 
@@ -25,39 +24,30 @@ class TestConfigurationParsing:
         # Create a valid configuration content with the given text as additional content
         valid_config_content = self._create_valid_config_base() + "\n" + content
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as f:
-            f.write(valid_config_content)
-            temp_path = f.name
-        
-        try:
-            parser = ConfigParser()
-            config = parser.load_config(temp_path)
-            
-            # Verify all required sections are extracted
-            assert config is not None, "Configuration should not be None"
-            assert config.peak_windows is not None, "Peak windows should be extracted"
-            assert config.zones is not None, "Zones should be extracted"
-            assert config.hotspots is not None, "Hotspots should be extracted"
-            assert config.explanation_templates is not None, "Explanation templates should be extracted"
-            assert config.scoring_rules is not None, "Scoring rules should be extracted"
-            
-            # Verify peak windows have required fields
-            assert config.peak_windows.weekday_morning is not None, "Weekday morning peak should be extracted"
-            assert config.peak_windows.weekday_evening is not None, "Weekday evening peak should be extracted"
-            assert config.peak_windows.weekend_pattern is not None, "Weekend pattern should be extracted"
-            
-            # Verify zones is a dictionary
-            assert isinstance(config.zones, dict), "Zones should be a dictionary"
-            
-            # Verify hotspots is a list
-            assert isinstance(config.hotspots, list), "Hotspots should be a list"
-            
-            # Verify explanation templates is a dictionary
-            assert isinstance(config.explanation_templates, dict), "Explanation templates should be a dictionary"
-            
-        finally:
-            # Clean up temporary file
-            Path(temp_path).unlink(missing_ok=True)
+        parser = ConfigParser()
+        config = parser.load_from_string(valid_config_content)
+        
+        # Verify all required sections are extracted
+        assert config is not None, "Configuration should not be None"
+        assert config.peak_windows is not None, "Peak windows should be extracted"
+        assert config.zones is not None, "Zones should be extracted"
+        assert config.hotspots is not None, "Hotspots should be extracted"
+        assert config.explanation_templates is not None, "Explanation templates should be extracted"
+        assert config.scoring_rules is not None, "Scoring rules should be extracted"
+        
+        # Verify peak windows have required fields
+        assert config.peak_windows.weekday_morning is not None, "Weekday morning peak should be extracted"
+        assert config.peak_windows.weekday_evening is not None, "Weekday evening peak should be extracted"
+        assert config.peak_windows.weekend_pattern is not None, "Weekend pattern should be extracted"
+        
+        # Verify zones is a dictionary
+        assert isinstance(config.zones, dict), "Zones should be a dictionary"
+        
+        # Verify hotspots is a list
+        assert isinstance(config.hotspots, list), "Hotspots should be a list"
+        
+        # Verify explanation templates is a dictionary
+        assert isinstance(config.explanation_templates, dict), "Explanation templates should be a dictionary"
     
     def test_actual_product_config_parsing(self):
         """Test parsing the actual product.md configuration file"""
@@ -77,6 +67,17 @@ class TestConfigurationParsing:
         assert 'zone_central' in config.zones
         assert 'zone_dense_core' in config.zones
         
+        # Verify the reverse area -> zone index matches the zone listings
+        assert config.area_to_zone['gachibowli'] == 'zone_it_corridor'
+        assert config.area_to_zone['charminar'] == 'zone_dense_core'
+        for zone_name, areas in config.zones.items():
+            for area in areas:
+                assert area.casefold() in config.area_to_zone
+        
+        # Verify the location list covers every zone's areas once, in order
+        all_areas = {area for areas in config.zones.values() for area in areas}
+        assert config.all_areas_sorted == tuple(sorted(all_areas))
+        
         # Verify hotspots are properly parsed
         assert len(config.hotspots) >= 20, "Should have at least 20 hotspots"
         assert 'Gachibowli' in config.hotspots
@@ -87,6 +88,48 @@ class TestConfigurationParsing:
         assert 'Peak window triggered' in config.explanation_templates
         assert 'IT corridor triggered' in config.explanation_templates
     
+    def test_disk_cache_can_be_disabled(self, tmp_path):
+        """Test that an empty cache directory setting skips the on-disk cache"""
+        config_file = tmp_path / "product.md"
+        config_file.write_text(self._create_valid_config_base(), encoding='utf-8')
+        
+        parser = ConfigParser(cache_dir="")
+        config = parser.load_config(str(config_file))
+        
+        assert parser.cache_dir is None
+        assert 'zone_it_corridor' in config.zones
+        assert [path.name for path in tmp_path.iterdir()] == ["product.md"]
+    
+    def test_repeated_loads_return_independent_configs(self, tmp_path):
+        """Test that changing one loaded config does not leak into later loads"""
+        config_file = tmp_path / "product.md"
+        config_file.write_text(self._create_valid_config_base(), encoding='utf-8')
+        
+        parser = ConfigParser(cache_dir="")
+        first = parser.load_config(str(config_file))
+        first.zones['zone_it_corridor'].append("Nowhere")
+        first.hotspots.append("Nowhere")
+        first.explanation_templates.clear()
+        
+        second = parser.load_config(str(config_file))
+        assert second is not first
+        assert "Nowhere" not in second.zones['zone_it_corridor']
+        assert "Nowhere" not in second.hotspots
+        assert second.explanation_templates
+    
+    def test_disk_cache_is_pruned(self, tmp_path, monkeypatch):
+        """Test that the on-disk cache keeps only the most recently used configs"""
+        monkeypatch.setattr(config_parser, "CONFIG_CACHE_MAX_ENTRIES", 2)
+        cache_dir = tmp_path / "cache"
+        parser = ConfigParser(cache_dir=str(cache_dir))
+        
+        for index in range(4):
+            config_file = tmp_path / f"product_{index}.md"
+            config_file.write_text(self._create_valid_config_base() + f"\n<!-- {index} -->\n", encoding='utf-8')
+            parser.load_config(str(config_file))
+        
+        assert len(list(cache_dir.glob("*.pkl"))) == 2
+    
     def _create_valid_config_base(self) -> str:
         """Create a minimal valid configuration for testing"""
         return """
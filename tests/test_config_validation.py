@@ -33,48 +33,39 @@ class TestConfigurationValidation:
             has_peak_windows, has_zones, has_hotspots, has_templates
         )
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as f:
-            f.write(config_content)
-            temp_path = f.name
+        parser = ConfigParser()
+        config = parser.load_from_string(config_content)
+        validation = parser.validate_config(config)
         
-        try:
-            parser = ConfigParser()
-            config = parser.load_config(temp_path)
-            validation = parser.validate_config(config)
-            
-            # Verify validation correctly identifies missing sections
-            if not has_peak_windows:
-                assert not validation.is_valid, "Should be invalid when peak windows are missing"
-                assert any("peak window" in error.lower() for error in validation.errors), \
-                    f"Should have error about missing peak windows. Actual errors: {validation.errors}"
-            
-            if not has_zones:
-                assert not validation.is_valid, "Should be invalid when zones are missing"
-                assert any("zones" in error.lower() for error in validation.errors), \
-                    f"Should have error about missing zones. Actual errors: {validation.errors}"
-            
-            # If all required sections are present, validation should pass
-            if has_peak_windows and has_zones:
-                assert validation.is_valid, "Should be valid when required sections are present"
-            
-            # Validation result should always have proper structure
-            assert isinstance(validation.is_valid, bool), "is_valid should be boolean"
-            assert isinstance(validation.errors, list), "errors should be a list"
-            assert isinstance(validation.warnings, list), "warnings should be a list"
-            
-            # All error messages should be strings
-            for error in validation.errors:
-                assert isinstance(error, str), "All errors should be strings"
-                assert len(error) > 0, "Error messages should not be empty"
-            
-            # All warning messages should be strings
-            for warning in validation.warnings:
-                assert isinstance(warning, str), "All warnings should be strings"
-                assert len(warning) > 0, "Warning messages should not be empty"
-                
-        finally:
-            # Clean up temporary file
-            Path(temp_path).unlink(missing_ok=True)
+        # Verify validation correctly identifies missing sections
+        if not has_peak_windows:
+            assert not validation.is_valid, "Should be invalid when peak windows are missing"
+            assert any("peak window" in error.lower() for error in validation.errors), \
+                f"Should have error about missing peak windows. Actual errors: {validation.errors}"
+        
+        if not has_zones:
+            assert not validation.is_valid, "Should be invalid when zones are missing"
+            assert any("zones" in error.lower() for error in validation.errors), \
+                f"Should have error about missing zones. Actual errors: {validation.errors}"
+        
+        # If all required sections are present, validation should pass
+        if has_peak_windows and has_zones:
+            assert validation.is_valid, "Should be valid when required sections are present"
+        
+        # Validation result should always have proper structure
+        assert isinstance(validation.is_valid, bool), "is_valid should be boolean"
+        assert isinstance(validation.errors, list), "errors should be a list"
+        assert isinstance(validation.warnings, list), "warnings should be a list"
+        
+        # All error messages should be strings
+        for error in validation.errors:
+            assert isinstance(error, str), "All errors should be strings"
+            assert len(error) > 0, "Error messages should not be empty"
+        
+        # All warning messages should be strings
+        for warning in validation.warnings:
+            assert isinstance(warning, str), "All warnings should be strings"
+            assert len(warning) > 0, "Warning messages should not be empty"
     
     def test_malformed_peak_windows_validation(self):
         """Test validation of malformed peak windows"""
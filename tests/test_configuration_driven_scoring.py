@@ -10,12 +10,27 @@ from app.traffic_controller import TrafficController
 from parsers.config_parser import ConfigParser
 
 
+# Location names made of letters and spaces, shared by origin and destination
+_NAME_ALPHABET = st.characters(whitelist_categories=('Lu', 'Ll', 'Zs'))
+_NAME_TEXT = st.text(min_size=1, max_size=50, alphabet=_NAME_ALPHABET)
+
+
 class TestConfigurationDrivenScoring:
     """Property-based tests for configuration-driven scoring"""
     
+    def setup_method(self):
+        """Write the custom configuration once for all generated examples"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as f:
+            f.write(self._create_custom_config())
+            self.custom_config_path = f.name
+    
+    def teardown_method(self):
+        """Clean up the custom configuration file"""
+        Path(self.custom_config_path).unlink(missing_ok=True)
+    
     @given(
-        st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Zs'))),  # origin
-        st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Zs'))),  # destination
+        _NAME_TEXT,  # origin
+        _NAME_TEXT,  # destination
         st.datetimes(min_value=datetime(2024, 1, 1), max_value=datetime(2024, 12, 31)),  # departure_time
     )
     @settings(max_examples=100)
@@ -27,82 +42,70 @@ class TestConfigurationDrivenScoring:
         For any origin and destination locations, the congestion score calculation 
         should reference only rules loaded from Product_Config and never use hardcoded values
         """
-        # Create a custom configuration with specific rules
-        custom_config_content = self._create_custom_config()
+        # Create traffic controller with the custom config written in setup_method
+        controller = TrafficController(self.custom_config_path)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as f:
-            f.write(custom_config_content)
-            temp_path = f.name
+        # Analyze route
+        analysis = controller.analyze_route(origin, destination, departure_time)
         
-        try:
-            # Create traffic controller with custom config
-            controller = TrafficController(temp_path)
-            
-            # Analyze route
-            analysis = controller.analyze_route(origin, destination, departure_time)
-            
-            # Verify that scoring uses only configuration-driven rules
-            # The scoring should be based on the custom config we provided
-            
-            # Check that the analysis uses the configuration data
-            assert analysis is not None, "Analysis should not be None"
-            assert analysis.congestion is not None, "Congestion result should not be None"
-            
-            # Verify that the scoring engine was initialized with our custom config
-            assert controller.config is not None, "Controller should have loaded config"
-            assert controller.config.zones is not None, "Config should have zones"
-            assert controller.config.hotspots is not None, "Config should have hotspots"
-            assert controller.config.peak_windows is not None, "Config should have peak windows"
-            
-            # Verify that the scoring uses configuration data, not hardcoded values
-            # Check that zones from our custom config are being used
-            custom_zones = controller.config.zones
-            assert len(custom_zones) > 0, "Should have loaded custom zones"
-            
-            # Check that hotspots from our custom config are being used
-            custom_hotspots = controller.config.hotspots
-            assert len(custom_hotspots) > 0, "Should have loaded custom hotspots"
-            
-            # Check that peak windows from our custom config are being used
-            peak_windows = controller.config.peak_windows
-            assert peak_windows.weekday_morning is not None, "Should have loaded custom morning peak"
-            assert peak_windows.weekday_evening is not None, "Should have loaded custom evening peak"
-            
-            # Verify that the scoring result is consistent with configuration rules
-            # If the origin/destination matches our custom hotspots, and it's peak time,
-            # the scoring should reflect that
-            is_peak_time = self._is_peak_time(departure_time, peak_windows)
-            has_custom_hotspot = self._has_custom_hotspot(origin, destination, custom_hotspots)
-            has_custom_it_corridor = self._has_custom_it_corridor(origin, destination, custom_zones)
-            
-            # The congestion level should be influenced by these configuration-driven factors
-            # However, if areas are unknown, the system should respond with unknown area message
-            unknown_message = "That area isn't in my local dataset yet—add it to product.md"
-            
-            if unknown_message in analysis.congestion.reasoning:
-                # This is the expected behavior for unknown areas - configuration-driven response
-                # The new implementation provides more detailed messages, so check for the base message
-                assert unknown_message in analysis.congestion.reasoning, \
-                    "Unknown areas should contain the standard configuration-driven message"
-            elif is_peak_time and (has_custom_hotspot or has_custom_it_corridor):
-                # Should have some triggered rules based on configuration for known areas
-                assert len(analysis.congestion.triggered_rules) > 0, \
-                    "Should have triggered rules when peak time and hotspot/IT corridor detected"
-            
-            # Verify that explanation templates come from configuration
-            if analysis.congestion.reasoning:
-                # The reasoning should use templates from our configuration
-                templates = controller.config.explanation_templates
-                reasoning_uses_config = any(
-                    template_text in analysis.congestion.reasoning 
-                    for template_text in templates.values()
-                )
-                # Note: reasoning might be "That area isn't in my local dataset yet" for unknown areas
-                # which is also configuration-driven behavior
-                
-        finally:
-            # Clean up temporary file
-            Path(temp_path).unlink(missing_ok=True)
+        # Verify that scoring uses only configuration-driven rules
+        # The scoring should be based on the custom config we provided
+        
+        # Check that the analysis uses the configuration data
+        assert analysis is not None, "Analysis should not be None"
+        assert analysis.congestion is not None, "Congestion result should not be None"
+        
+        # Verify that the scoring engine was initialized with our custom config
+        assert controller.config is not None, "Controller should have loaded config"
+        assert controller.config.zones is not None, "Config should have zones"
+        assert controller.config.hotspots is not None, "Config should have hotspots"
+        assert controller.config.peak_windows is not None, "Config should have peak windows"
+        
+        # Verify that the scoring uses configuration data, not hardcoded values
+        # Check that zones from our custom config are being used
+        custom_zones = controller.config.zones
+        assert len(custom_zones) > 0, "Should have loaded custom zones"
+        
+        # Check that hotspots from our custom config are being used
+        custom_hotspots = controller.config.hotspots
+        assert len(custom_hotspots) > 0, "Should have loaded custom hotspots"
+        
+        # Check that peak windows from our custom config are being used
+        peak_windows = controller.config.peak_windows
+        assert peak_windows.weekday_morning is not None, "Should have loaded custom morning peak"
+        assert peak_windows.weekday_evening is not None, "Should have loaded custom evening peak"
+        
+        # Verify that the scoring result is consistent with configuration rules
+        # If the origin/destination matches our custom hotspots, and it's peak time,
+        # the scoring should reflect that
+        is_peak_time = self._is_peak_time(departure_time, peak_windows)
+        has_custom_hotspot = self._has_custom_hotspot(origin, destination, custom_hotspots)
+        has_custom_it_corridor = self._has_custom_it_corridor(origin, destination, custom_zones)
+        
+        # The congestion level should be influenced by these configuration-driven factors
+        # However, if areas are unknown, the system should respond with unknown area message
+        unknown_message = "That area isn't in my local dataset yet—add it to product.md"
+        
+        if unknown_message in analysis.congestion.reasoning:
+            # This is the expected behavior for unknown areas - configuration-driven response
+            # The new implementation provides more detailed messages, so check for the base message
+            assert unknown_message in analysis.congestion.reasoning, \
+                "Unknown areas should contain the standard configuration-driven message"
+        elif is_peak_time and (has_custom_hotspot or has_custom_it_corridor):
+            # Should have some triggered rules based on configuration for known areas
+            assert len(analysis.congestion.triggered_rules) > 0, \
+                "Should have triggered rules when peak time and hotspot/IT corridor detected"
+        
+        # Verify that explanation templates come from configuration
+        if analysis.congestion.reasoning:
+            # The reasoning should use templates from our configuration
+            templates = controller.config.explanation_templates
+            reasoning_uses_config = any(
+                template_text in analysis.congestion.reasoning 
+                for template_text in templates.values()
+            )
+            # Note: reasoning might be "That area isn't in my local dataset yet" for unknown areas
+            # which is also configuration-driven behavior
     
     def test_different_configs_produce_different_results(self):
         """Test that different configurations produce different scoring results"""
@@ -234,20 +237,21 @@ class TestConfigurationDrivenScoring:
     
     def _has_custom_hotspot(self, origin, destination, hotspots) -> bool:
         """Check if origin or destination is in custom hotspots"""
+        hotspots_lower = [hotspot.lower() for hotspot in hotspots]
         locations = [origin.lower(), destination.lower()]
         return any(
-            any(hotspot.lower() in location or location in hotspot.lower()
-                for hotspot in hotspots)
+            any(hotspot in location or location in hotspot
+                for hotspot in hotspots_lower)
             for location in locations
         )
     
     def _has_custom_it_corridor(self, origin, destination, zones) -> bool:
         """Check if origin or destination is in custom IT corridor"""
-        it_corridor_areas = zones.get('zone_it_corridor', [])
+        it_corridor_areas = [area.lower() for area in zones.get('zone_it_corridor', [])]
         locations = [origin.lower(), destination.lower()]
         
         return any(
-            any(area.lower() in location or location in area.lower()
+            any(area in location or location in area
                 for area in it_corridor_areas)
             for location in locations
         )
\ No newline at end of file
@@ -6,6 +6,7 @@ from datetime import datetime
 from hypothesis import given, strategies as st, settings, assume
 from parsers.config_parser import ConfigParser
 from app.traffic_controller import TrafficController
+from filtering.content_filter import ContentFilter, FilterPreferences
 
 
 class TestPreferenceBasedFiltering:
@@ -186,4 +187,40 @@ class TestPreferenceBasedFiltering:
         # Verify core functionality is maintained
         assert analysis.congestion.level is not None
         assert analysis.congestion.score >= 0
-        assert isinstance(analysis.congestion.triggered_rules, list)
\ No newline at end of file
+        assert isinstance(analysis.congestion.triggered_rules, list)
+    
+    @given(
+        st.lists(
+            st.lists(
+                st.sampled_from(['bar', 'pub', 'late night', 'casino', 'stop', 'suggest',
+                                 'recommendation', 'rest', 'route', ' ', '  ', '\n', '.']),
+                max_size=8
+            ).map(' '.join),
+            min_size=1, max_size=5
+        ),
+        st.booleans(),
+        st.booleans(),
+    )
+    @settings(max_examples=100)
+    def test_batch_filtering_matches_single_text_filtering(self, texts, avoid_nightlife,
+                                                           prefer_family_friendly):
+        """Test that filtering texts in a batch matches filtering each text on its own"""
+        content_filter = ContentFilter()
+        preferences = FilterPreferences(
+            avoid_nightlife=avoid_nightlife,
+            prefer_family_friendly=prefer_family_friendly
+        )
+        
+        expected = [content_filter.filter_text(text, preferences) for text in texts]
+        
+        assert content_filter.filter_texts(texts, preferences) == expected
+    
+    def test_term_removal_collapses_whitespace(self):
+        """Test that removing terms leaves single spaces and no surrounding whitespace"""
+        content_filter = ContentFilter()
+        preferences = FilterPreferences(avoid_nightlife=True)
+        
+        # \x1c is whitespace to str.split as well as to the old \s+ cleanup
+        filtered = content_filter.filter_text(" Head to the  bar and\x1cpub \t now ", preferences)
+        
+        assert filtered == "Head to the and now"
@@ -2,6 +2,7 @@
 Property-based tests for scoring rule application
 **Feature: hyderabad-traffic-guide, Property 4: Scoring rule application**
 """
+import pytest
 from datetime import datetime, time
 from hypothesis import given, strategies as st, settings, assume
 from parsers.config_parser import ConfigParser
@@ -168,4 +169,55 @@ class TestScoringRuleApplication:
         assert isinstance(result.triggered_rules, list)
         assert isinstance(result.departure_recommendation, str)
         assert isinstance(result.reasoning, str)
-        assert len(result.departure_recommendation) > 0
\ No newline at end of file
+        assert len(result.departure_recommendation) > 0
+    
+    @given(
+        st.sampled_from(['Gachibowli', 'Ameerpet', 'Charminar', 'Unknown Area']),
+        st.sampled_from(['Hitec City', 'Koti', 'Secunderabad', 'Unknown Area']),
+        st.integers(min_value=0, max_value=23),
+        st.integers(min_value=0, max_value=59),
+        st.integers(min_value=0, max_value=6),
+    )
+    @settings(max_examples=50)
+    def test_repeated_calculation_consistency(self, origin, destination, hour, minute, weekday):
+        """Test that repeated and differently cased requests score the same, in independent results"""
+        test_time = datetime(2024, 1, 1 + weekday, hour, minute)
+        
+        first = self.engine.calculate_congestion(origin, destination, test_time)
+        first.triggered_rules.append("Mutated by caller")
+        second = self.engine.calculate_congestion(origin.upper(), destination.lower(), test_time)
+        
+        assert second.score == first.score
+        assert second.level == first.level
+        assert second.triggered_rules == first.triggered_rules[:-1]
+        assert "Mutated by caller" not in second.triggered_rules
+    
+    @given(
+        st.lists(
+            st.tuples(
+                st.sampled_from(['Gachibowli', 'Ameerpet', 'Charminar', 'Unknown Area', '']),
+                st.sampled_from(['Hitec City', 'Koti', 'Secunderabad', 'Unknown Area']),
+                st.integers(min_value=0, max_value=23),
+                st.integers(min_value=0, max_value=59),
+                st.integers(min_value=0, max_value=6),
+            ),
+            max_size=10,
+        )
+    )
+    @settings(max_examples=30)
+    def test_batch_calculation_matches_single(self, routes):
+        """Test that batch results match calculating each route on its own"""
+        origins = [route[0] for route in routes]
+        destinations = [route[1] for route in routes]
+        times = [datetime(2024, 1, 1 + weekday, hour, minute) for _, _, hour, minute, weekday in routes]
+        
+        batch = self.engine.calculate_congestion_batch(origins, destinations, times)
+        
+        assert len(batch) == len(routes)
+        for result, origin, destination, test_time in zip(batch, origins, destinations, times):
+            assert result == self.engine.calculate_congestion(origin, destination, test_time)
+    
+    def test_batch_calculation_length_mismatch(self):
+        """Test that batch calculation rejects inputs of different lengths"""
+        with pytest.raises(ValueError):
+            self.engine.calculate_congestion_batch(['Gachibowli'], [], [datetime(2024, 1, 1, 9, 0)])
\ No newline at end of file
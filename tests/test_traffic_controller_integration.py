@@ -253,6 +253,35 @@ No proper sections or formatting.
         finally:
             os.unlink(temp_config_path)
     
+    def test_configuration_reloaded_after_file_change(self):
+        """Test that an edited configuration file is parsed again on the next load"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
+            f.write("""
+### Zones
+- zone_test:
+  - TestArea1
+""")
+            temp_config_path = f.name
+        
+        try:
+            parser = ConfigParser()
+            first_config = parser.load_config(temp_config_path)
+            assert first_config.zones == {'zone_test': ['TestArea1']}
+            
+            # Loading the unchanged file again gives an equal, independent config
+            reloaded_config = parser.load_config(temp_config_path)
+            assert reloaded_config == first_config
+            assert reloaded_config is not first_config
+            
+            with open(temp_config_path, 'a') as f:
+                f.write("  - TestArea2\n")
+            
+            updated_config = parser.load_config(temp_config_path)
+            assert updated_config.zones == {'zone_test': ['TestArea1', 'TestArea2']}
+            
+        finally:
+            os.unlink(temp_config_path)
+    
     def test_configuration_validation_comprehensive(self):
         """Test comprehensive configuration validation"""
         parser = ConfigParser()
@@ -293,6 +322,56 @@ No proper sections or formatting.
             # Case insensitive matching should work for known areas
             if info1.zone or info1.is_hotspot:
                 assert info3.zone == info1.zone or info3.is_hotspot == info1.is_hotspot
+    
+    def test_area_zone_lookup_matches_config_listing(self):
+        """Test that every configured area resolves to the first zone listing it"""
+        controller = TrafficController()
+        
+        expected_zones = {}
+        for zone_name, areas in controller.config.zones.items():
+            for area in areas:
+                expected_zones.setdefault(area.lower(), zone_name)
+        
+        for area_lower, zone_name in expected_zones.items():
+            assert controller.get_area_info(area_lower).zone == zone_name
+            assert controller.get_area_info(area_lower.upper()).zone == zone_name
+    
+    def test_area_naming_several_known_areas_uses_config_order(self):
+        """Test that a query naming several areas takes the zone of the one listed first"""
+        controller = TrafficController()
+        
+        # Gachibowli (IT corridor) is listed before Abids (central), which is
+        # listed before LB Nagar (dense core), wherever they appear in the query
+        assert controller.get_area_info("Abids Gachibowli").zone == "zone_it_corridor"
+        assert controller.get_area_info("Gachibowli Abids").zone == "zone_it_corridor"
+        assert controller.get_area_info("LB Nagar Abids").zone == "zone_central"
+    
+    def test_hotspot_warnings_use_names_as_given(self):
+        """Test that hotspot warnings quote the route endpoints as the user typed them"""
+        controller = TrafficController()
+        
+        analysis = controller.analyze_route(
+            "  gachibowli ",
+            "Hitec City",
+            datetime(2024, 1, 1, 9, 0)  # Monday 9 AM
+        )
+        
+        assert analysis.hotspot_warnings == [
+            "Origin   gachibowli  is a known traffic hotspot",
+            "Destination Hitec City is a known traffic hotspot",
+        ]
+    
+    def test_padded_hotspot_names_score_like_unpadded(self):
+        """Test that surrounding whitespace does not change scoring or warnings for a hotspot"""
+        controller = TrafficController()
+        
+        for departure_time in (datetime(2024, 1, 1, 9, 0), datetime(2024, 1, 6, 12, 0)):
+            padded = controller.analyze_route(" Rasoolpura / CTO ", " Rasoolpura / CTO ", departure_time)
+            plain = controller.analyze_route("Rasoolpura / CTO", "Rasoolpura / CTO", departure_time)
+            
+            assert padded.congestion.level == plain.congestion.level
+            assert padded.congestion.triggered_rules == plain.congestion.triggered_rules
+            assert len(padded.hotspot_warnings) == len(plain.hotspot_warnings) == 2
 
 
 class TestSystemIntegrationScenarios:
@@ -415,4 +494,22 @@ class TestSystemIntegrationScenarios:
         for result in results[1:]:
             assert result.congestion.level == first_result.congestion.level
             assert result.congestion.score == first_result.congestion.score
-            assert result.congestion.reasoning == first_result.congestion.reasoning
\ No newline at end of file
+            assert result.congestion.reasoning == first_result.congestion.reasoning
+    
+    def test_batch_analysis_matches_single_analyses(self):
+        """Test that analyze_routes returns the same results as analyze_route per route"""
+        controller = TrafficController()
+        
+        routes = [
+            ("Gachibowli", "Ameerpet", datetime(2024, 1, 1, 9, 0)),
+            ("  Gachibowli ", "Hitec City", datetime(2024, 1, 1, 18, 30)),
+            ("Jubilee Hills", "Secunderabad", datetime(2024, 1, 6, 10, 0)),
+            ("UnknownPlace", "Gachibowli", datetime(2024, 1, 1, 9, 0)),
+            ("", "Gachibowli", datetime(2024, 1, 1, 9, 0)),
+        ]
+        
+        batch_results = controller.analyze_routes(routes)
+        
+        assert len(batch_results) == len(routes)
+        for route, batch_result in zip(routes, batch_results):
+            assert batch_result == controller.analyze_route(*route)
\ No newline at end of file